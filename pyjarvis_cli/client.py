@@ -3,12 +3,12 @@ IPC client for CLI
 """
 
 import asyncio
-import json
 import struct
 import sys
 from typing import Optional
+import orjson
 from loguru import logger
-from pyjarvis_shared import TextToVoiceRequest, ServiceCommand, ServiceResponse, AppConfig
+from pyjarvis_shared import TextToVoiceRequest, ServiceCommand, ServiceResponse, AppConfig, default_config, unpack_payload
 
 async def send_text_to_service(text: str, language: Optional[str] = None) -> None:
     """
@@ -22,7 +22,7 @@ async def send_text_to_service(text: str, language: Optional[str] = None) -> Non
     logger.debug(f"[CLI] Target text: '{text}'")
     logger.debug(f"[CLI] Language override: {language}")
     
-    config = AppConfig()
+    config = default_config()
     request = TextToVoiceRequest(text=text, language=language)
     command = ServiceCommand.process_text(request)
     
@@ -40,7 +40,7 @@ async def _send_via_tcp(command: ServiceCommand, config: AppConfig) -> None:
         #logger.info("[CLI] Connected to service (TCP)")
         
         # Send command
-        data = json.dumps(command.model_dump()).encode('utf-8')
+        data = orjson.dumps(command.model_dump())
         length = len(data)
         
         # Send length prefix
@@ -75,8 +75,9 @@ async def _send_via_tcp(command: ServiceCommand, config: AppConfig) -> None:
         
         # Deserialize JSON
        # logger.debug("[CLI] Deserializing response JSON...")
-        response_dict = json.loads(data.decode('utf-8'))
-        response = ServiceResponse(**response_dict)
+        json_bytes, audio_data = unpack_payload(data)
+        response_dict = orjson.loads(json_bytes)
+        response = ServiceResponse(**response_dict, audio_data=audio_data)
         #logger.info(f"[CLI] Response deserialized: {response.response_type}")
         
         # Handle response
@@ -16,6 +16,7 @@ class AnimationState:
     emotion: Emotion = Emotion.NEUTRAL
     last_blink: float = 0.0
     is_blinking: bool = False
+    elapsed: float = 0.0  # Seconds since the controller started, as of the last update
 
 
 class AnimationController:
@@ -42,12 +43,14 @@ class AnimationController:
             dt: Delta time in seconds
             audio_level: Current audio level (0.0 to 1.0) for mouth sync
         """
+        # Read the clock once per frame; blinking and the renderer's effects all use this time
+        self.state.elapsed = time.time() - self._start_time
         self._update_blink(dt)
         self._update_mouth(audio_level)
     
     def _update_blink(self, dt: float) -> None:
         """Update blink animation"""
-        current_time = time.time() - self._start_time
+        current_time = self.state.elapsed
         elapsed_since_blink = current_time - self.state.last_blink
         
         if not self.state.is_blinking:
@@ -90,6 +93,11 @@ class AnimationController:
         """Get current animation state"""
         return self.state
     
+    @property
+    def active(self) -> bool:
+        """Whether a blink or mouth movement is in progress (the face is not at rest)"""
+        return self.state.is_blinking or self.state.mouth_open > 0.01
+    
     @property
     def eye_blink(self) -> float:
         """Get current eye blink value (0.0 = open, 1.0 = closed)"""
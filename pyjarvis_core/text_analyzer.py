@@ -3,13 +3,15 @@ Text analysis for context and emotion detection
 """
 
 import asyncio
+import os
+from functools import lru_cache
 from typing import Optional
 from loguru import logger
 from pyjarvis_shared import Emotion, Language
 
 # Try to import langdetect (lightweight and reliable)
 try:
-    from langdetect import detect, DetectorFactory
+    from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
     # Set seed for consistent results
     DetectorFactory.seed = 0
     LANGDETECT_AVAILABLE = True
@@ -17,13 +19,45 @@ except ImportError:
     LANGDETECT_AVAILABLE = False
     logger.warning("langdetect not available, using heuristic language detection")
 
+# langdetect profiles to load: only the languages we support (langdetect ships 55)
+LANGDETECT_LANGUAGES = ("en", "pt", "es")
+
+
+@lru_cache(maxsize=1)
+def _load_language_profiles() -> "DetectorFactory":
+    """Create a langdetect detector factory with only the LANGDETECT_LANGUAGES profiles (shared)"""
+    profiles = []
+    for code in LANGDETECT_LANGUAGES:
+        with open(os.path.join(PROFILES_DIRECTORY, code), encoding="utf-8") as f:
+            profiles.append(f.read())
+    
+    factory = DetectorFactory()
+    factory.load_json_profile(profiles)
+    return factory
+
 
 class TextAnalyzer:
     """Text analyzer for extracting context, emotion, and language"""
     
     def __init__(self):
         """Create a new text analyzer"""
-        pass
+        self._language_pipeline: Optional["DetectorFactory"] = None  # Loaded on first language detection
+        self._initialized = False
+    
+    async def _initialize_language_detection(self) -> None:
+        """Load the language detection profiles (in thread pool, they are read from disk)"""
+        if self._initialized:
+            return
+        if LANGDETECT_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            self._language_pipeline = await loop.run_in_executor(None, _load_language_profiles)
+        self._initialized = True
+    
+    def _detect_language_code(self, text: str) -> str:
+        """Run langdetect over the text (blocking)"""
+        detector = self._language_pipeline.create()
+        detector.append(text)
+        return detector.detect()
     
     async def detect_emotion(self, text: str) -> Emotion:
         """
@@ -58,12 +92,11 @@ class TextAnalyzer:
         # Use langdetect if available
         if LANGDETECT_AVAILABLE:
             try:
+                await self._initialize_language_detection()
+                
                 # Run detection in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                detected_code = await loop.run_in_executor(
-                    None,
-                    lambda: detect(text)
-                )
+                loop = asyncio.get_running_loop()
+                detected_code = await loop.run_in_executor(None, self._detect_language_code, text)
                 
                 logger.debug(f"Detected language code: {detected_code}")
                 
@@ -2,12 +2,21 @@
 Base TTS Processor interface (Strategy Pattern)
 """
 
+import asyncio
+import hashlib
+import itertools
+import os
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional, Sequence, Union
 from pathlib import Path
 from pyjarvis_shared import Language
 
+# Per-process sequence appended to output file names, so identical requests
+# synthesized in the same millisecond (e.g. one batch) never share a file
+_output_sequence = itertools.count()
+
 
 @dataclass
 class TtsProcessorResult:
@@ -30,6 +39,8 @@ class TtsProcessor(ABC):
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Directory prefix for output files, so building a file path is a plain string concat
+        self._output_prefix = str(self.output_dir) + os.sep
         self._initialized = False
     
     @abstractmethod
@@ -51,6 +62,30 @@ class TtsProcessor(ABC):
         """
         pass
     
+    async def synthesize_batch(
+        self,
+        texts: Sequence[str],
+        languages: Sequence[Language]
+    ) -> List[Union[TtsProcessorResult, BaseException]]:
+        """
+        Generate speech for several texts at once
+        
+        The default runs synthesize for every text concurrently, which overlaps
+        network/thread time. Processors whose engine accepts batched input
+        should override this with a single batched call.
+        
+        Args:
+            texts: Texts to synthesize
+            languages: Target language for each text
+            
+        Returns:
+            One TtsProcessorResult, or the exception raised for it, per text
+        """
+        return await asyncio.gather(
+            *(self.synthesize(text, language) for text, language in zip(texts, languages)),
+            return_exceptions=True
+        )
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -73,14 +108,12 @@ class TtsProcessor(ABC):
         Returns:
             Path to output file
         """
-        import hashlib
-        import time
-        
-        # Create filename from text hash and timestamp
+        # Create filename from text hash, timestamp and a unique sequence number
         text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()[:8]
         timestamp = int(time.time() * 1000)  # milliseconds
+        sequence = next(_output_sequence)
         lang_code = language.value.lower()[:2]
-        filename = f"tts_{lang_code}_{text_hash}_{timestamp}.wav"
+        filename = f"tts_{lang_code}_{text_hash}_{timestamp}_{sequence}.wav"
         
-        return self.output_dir / filename
+        return Path(self._output_prefix + filename)
 
@@ -4,6 +4,8 @@ Uses edge-tts library for high-quality TTS with multiple voices
 """
 
 import asyncio
+from collections.abc import Mapping
+import aiofiles
 from pathlib import Path
 from typing import Optional, Dict
 from loguru import logger
@@ -56,7 +58,7 @@ class EdgeTtsProcessor(TtsProcessor):
         # Get voice config from AppConfig if available
         if self.config:
             config_voices = getattr(self.config, 'edge_tts_voices', None)
-            if config_voices and isinstance(config_voices, dict):
+            if config_voices and isinstance(config_voices, Mapping):
                 # Map config keys to Language enum
                 for lang_code, voice_name in config_voices.items():
                     lang_code_lower = lang_code.lower()
@@ -146,12 +148,9 @@ class EdgeTtsProcessor(TtsProcessor):
         # Generate audio using Edge TTS
         try:
             # Edge TTS communicate function generates audio
-            # Edge TTS saves files based on extension in the path
-            # We'll save as MP3 first, then convert to WAV if needed
             communicate = edge_tts.Communicate(text, voice)
             
-            # Edge TTS saves as MP3 by default when saving to file
-            # We'll save as MP3 and convert to WAV using pydub (like gTTS)
+            # Edge TTS streams MP3 audio; we save it to a temporary MP3 and convert to WAV using pydub (like gTTS)
             import tempfile
             import os
             
@@ -160,40 +159,17 @@ class EdgeTtsProcessor(TtsProcessor):
                 tmp_mp3_path = tmp_mp3.name
             
             try:
-                # Save MP3 using Edge TTS
-                await communicate.save(tmp_mp3_path)
+                # Collect the streamed MP3 and write it in one async write (the event loop never blocks on disk)
+                chunks = [
+                    message["data"] async for message in communicate.stream()
+                    if message["type"] == "audio"
+                ]
+                async with aiofiles.open(tmp_mp3_path, 'wb') as tmp_mp3:
+                    await tmp_mp3.write(b"".join(chunks))
                 
-                # Convert MP3 to WAV using pydub (if available)
-                try:
-                    from pydub import AudioSegment
-                    
-                    # Check if ffmpeg is available
-                    try:
-                        import subprocess
-                        subprocess.run(['ffmpeg', '-version'], 
-                                     stdout=subprocess.DEVNULL, 
-                                     stderr=subprocess.DEVNULL,
-                                     timeout=2)
-                    except (FileNotFoundError, subprocess.TimeoutExpired):
-                        # If ffmpeg not available, use MP3 directly (audio_player supports MP3)
-                        output_path_final = output_path.with_suffix('.mp3')
-                        import shutil
-                        shutil.move(tmp_mp3_path, str(output_path_final))
-                        logger.info(f"[Edge-TTS] Audio file saved as MP3: {output_path_final} (ffmpeg not available for WAV conversion)")
-                        output_path_wav = output_path_final
-                    else:
-                        # Convert to WAV
-                        output_path_wav = output_path.with_suffix('.wav')
-                        audio = AudioSegment.from_mp3(tmp_mp3_path)
-                        audio.export(str(output_path_wav), format="wav")
-                        logger.info(f"[Edge-TTS] Audio file converted and saved as WAV: {output_path_wav}")
-                except ImportError:
-                    # If pydub not available, use MP3 directly
-                    output_path_final = output_path.with_suffix('.mp3')
-                    import shutil
-                    shutil.move(tmp_mp3_path, str(output_path_final))
-                    logger.warning(f"[Edge-TTS] pydub not available, saved as MP3: {output_path_final}")
-                    output_path_wav = output_path_final
+                # The ffmpeg check and the conversion block, so run them in thread pool
+                loop = asyncio.get_running_loop()
+                output_path_wav = await loop.run_in_executor(None, self._finalize_audio, tmp_mp3_path, output_path)
             finally:
                 # Clean up temporary MP3 file
                 if os.path.exists(tmp_mp3_path):
@@ -220,6 +196,50 @@ class EdgeTtsProcessor(TtsProcessor):
             logger.error(f"[Edge-TTS] Failed to generate audio: {e}")
             raise RuntimeError(f"Edge TTS synthesis failed: {e}")
     
+    def _finalize_audio(self, tmp_mp3_path: str, output_path: Path) -> Path:
+        """
+        Convert the temporary MP3 to WAV (or keep it as MP3 if pydub/ffmpeg are missing)
+        
+        Args:
+            tmp_mp3_path: Temporary MP3 written from the Edge TTS stream
+            output_path: Output path for the audio file (its suffix is replaced)
+            
+        Returns:
+            Path to the final audio file
+        """
+        # Convert MP3 to WAV using pydub (if available)
+        try:
+            from pydub import AudioSegment
+            
+            # Check if ffmpeg is available
+            try:
+                import subprocess
+                subprocess.run(['ffmpeg', '-version'], 
+                             stdout=subprocess.DEVNULL, 
+                             stderr=subprocess.DEVNULL,
+                             timeout=2)
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                # If ffmpeg not available, use MP3 directly (audio_player supports MP3)
+                output_path_final = output_path.with_suffix('.mp3')
+                import shutil
+                shutil.move(tmp_mp3_path, str(output_path_final))
+                logger.info(f"[Edge-TTS] Audio file saved as MP3: {output_path_final} (ffmpeg not available for WAV conversion)")
+                return output_path_final
+            
+            # Convert to WAV
+            output_path_wav = output_path.with_suffix('.wav')
+            audio = AudioSegment.from_mp3(tmp_mp3_path)
+            audio.export(str(output_path_wav), format="wav")
+            logger.info(f"[Edge-TTS] Audio file converted and saved as WAV: {output_path_wav}")
+            return output_path_wav
+        except ImportError:
+            # If pydub not available, use MP3 directly
+            output_path_final = output_path.with_suffix('.mp3')
+            import shutil
+            shutil.move(tmp_mp3_path, str(output_path_final))
+            logger.warning(f"[Edge-TTS] pydub not available, saved as MP3: {output_path_final}")
+            return output_path_final
+    
     @property
     def name(self) -> str:
         """Processor name"""
@@ -59,7 +59,7 @@ class GttsProcessor(TtsProcessor):
         output_path = self._get_output_path(text, language)
         
         # Run gTTS in thread pool (it may block)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         
         def generate_audio():
             """Generate audio file synchronously"""
@@ -7,7 +7,16 @@ from .llama_client import OllamaClient
 from .cli import main
 from .personas import PersonaFactory, PersonaStrategy
 from .conversation_context import ConversationContext
-from .recording_queue import AudioRecordingQueue, get_recording_queue, RecordingStatus, RecordingTask, RecordingResult
+from .recording_queue import (
+    AudioRecordingQueue,
+    AsyncAudioRecordingQueue,
+    get_recording_queue,
+    get_async_recording_queue,
+    shutdown_async_recording_queue,
+    RecordingStatus,
+    RecordingTask,
+    RecordingResult,
+)
 
 __all__ = [
     "OllamaClient",
@@ -16,7 +25,10 @@ __all__ = [
     "PersonaStrategy",
     "ConversationContext",
     "AudioRecordingQueue",
+    "AsyncAudioRecordingQueue",
     "get_recording_queue",
+    "get_async_recording_queue",
+    "shutdown_async_recording_queue",
     "RecordingStatus",
     "RecordingTask",
     "RecordingResult",
@@ -7,12 +7,12 @@ import sys
 import threading
 from typing import Optional
 from loguru import logger
-from pyjarvis_shared import AppConfig, Language
+from pyjarvis_shared import AppConfig, Language, default_config
 from pyjarvis_core import TextAnalyzer
 from .llama_client import OllamaClient
 from .personas import PersonaFactory, PersonaStrategy
 from .conversation_context import ConversationContext
-from .recording_queue import get_recording_queue, RecordingStatus, RecordingResult
+from .recording_queue import get_async_recording_queue, shutdown_async_recording_queue, RecordingStatus, RecordingResult
 
 # Import CLI client to send text to service
 try:
@@ -186,6 +186,7 @@ async def interactive_loop(config: AppConfig) -> None:
                 
     finally:
         await ollama_client.close()
+        shutdown_async_recording_queue()
         # Clear all context files on exit
         context_manager.clear_all_contexts()
         logger.info("[Context] Application ended, contexts cleared")
@@ -211,16 +212,16 @@ async def record_and_process_audio(
         context_manager: Conversation context manager (optional)
     """
     # Get recording queue (singleton)
-    recording_queue = get_recording_queue()
+    recording_queue = get_async_recording_queue()
+    loop = asyncio.get_running_loop()
     
-    # Track recording state for UI feedback
-    current_status = RecordingStatus.PENDING
+    # Set (from the recording thread) once the recording leaves PENDING
+    started = asyncio.Event()
     transcribed_chunks = []
     
     def handle_status_update(status: RecordingStatus) -> None:
         """Callback para atualizações de status (Clean Code: função pequena e focada)"""
-        nonlocal current_status
-        current_status = status
+        loop.call_soon_threadsafe(started.set)
         
         status_messages = {
             RecordingStatus.INITIALIZING: "\nPreparing buffer for recording...",
@@ -240,47 +241,36 @@ async def record_and_process_audio(
             transcribed_chunks.append(text.strip())
             logger.debug(f"[CLI] Received text chunk: {text.strip()}")
     
-    # Submit recording task to queue
-    task_id = recording_queue.submit_task(
+    # Submit recording task to queue (runs in the queue's executor)
+    task = recording_queue.create_task(
         config=config,
         language=stt_language,
         on_status_update=handle_status_update,
         on_text_chunk=handle_text_chunk
     )
+    pending_result = asyncio.ensure_future(recording_queue.submit(task))
     
-    # Wait for recording to start (polling with timeout)
-    import time
-    max_wait_attempts = 10
-    for attempt in range(max_wait_attempts):
-        if current_status in [RecordingStatus.RECORDING, RecordingStatus.INITIALIZING]:
-            break
-        time.sleep(0.5)
-    
-    # Wait for user to press Enter to stop recording
+    # Wait for recording to start
     try:
-        input()  # Block until Enter is pressed
-    except (KeyboardInterrupt, EOFError):
-        pass
+        await asyncio.wait_for(started.wait(), timeout=5.0)
+    except asyncio.TimeoutError:
+        logger.warning("[CLI] Recording did not start within 5s")
+    
+    # Wait for user to press Enter to stop recording (off the event loop)
+    await _wait_for_enter()
     
     # Signal stop to the recording via queue
-    recording_queue.stop_recording(task_id)
-    logger.debug(f"[CLI] Stop signal sent for task {task_id}")
+    recording_queue.stop_recording(task.task_id)
+    logger.debug(f"[CLI] Stop signal sent for task {task.task_id}")
     
     # Wait for result with timeout (give enough time for transcription to complete)
-    logger.debug(f"[CLI] Waiting for recording result (task_id={task_id})...")
-    # Poll for result - the worker thread stores it as soon as transcription completes
+    logger.debug(f"[CLI] Waiting for recording result (task_id={task.task_id})...")
     result = None
     max_wait_time = 90.0
-    wait_start = time.time()
-    
-    while (time.time() - wait_start) < max_wait_time:
-        result = recording_queue.get_result(task_id, timeout=2.0)  # Short polling intervals
-        if result:
-            logger.debug(f"[CLI] Received result for task {task_id}")
-            break
-        time.sleep(0.2)  # Small delay between polls
-    
-    if not result:
+    try:
+        result = await asyncio.wait_for(pending_result, timeout=max_wait_time)
+        logger.debug(f"[CLI] Received result for task {task.task_id}")
+    except asyncio.TimeoutError:
         logger.warning(f"[CLI] Timeout waiting for result after {max_wait_time}s")
     
     # Handle result (Clean Code: early returns, clear error handling)
@@ -310,6 +300,30 @@ async def record_and_process_audio(
     )
 
 
+def _wait_for_enter() -> "asyncio.Future[None]":
+    """
+    Wait for the user to press Enter without blocking the event loop
+    
+    input() runs on a daemon thread rather than the default executor, so a read
+    still pending when the CLI exits never keeps the interpreter alive.
+    """
+    loop = asyncio.get_running_loop()
+    pressed = loop.create_future()
+    
+    def read_line() -> None:
+        try:
+            input()
+        except EOFError:
+            pass
+        try:
+            loop.call_soon_threadsafe(lambda: pressed.done() or pressed.set_result(None))
+        except RuntimeError:
+            pass  # Event loop already closed
+    
+    threading.Thread(target=read_line, name="cli-input", daemon=True).start()
+    return pressed
+
+
 def _print_no_speech_tips() -> None:
     """Print tips when no speech is detected (Extract Method refactoring)"""
     print("[WARNING] No speech detected or transcription failed.")
@@ -354,21 +368,19 @@ async def _process_user_input_with_llm(
         persona: Current AI persona
         context_manager: Conversation context manager
     """
-    # Build prompt using persona strategy
-    base_prompt = persona.build_prompt(user_input)
-    
-    # Load previous context and prepend to prompt
+    # Load previous context as the per-turn memory block, after the static
+    # persona prefix so the prefix stays cacheable across turns
+    memory_snippets = None
     if context_manager:
         previous_context = context_manager.load_previous_context()
         if previous_context:
-            prompt = f"{previous_context}\n\n{base_prompt}"
-        else:
-            prompt = base_prompt
+            memory_snippets = [previous_context]
         
         # Save request to context
         context_manager.save_request(user_input)
-    else:
-        prompt = base_prompt
+    
+    # Build prompt using persona strategy
+    prompt = persona.build_prompt(user_input, memory_snippets)
     
     # Show thinking indicator
     print("🤔 Thinking...", end="", flush=True)
@@ -420,7 +432,7 @@ def main() -> None:
     )
     
     # Load configuration
-    config = AppConfig()
+    config = default_config()
     
     # Run interactive loop
     try:
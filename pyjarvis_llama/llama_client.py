@@ -6,7 +6,7 @@ import aiohttp
 import json
 from typing import Optional
 from loguru import logger
-from pyjarvis_shared import AppConfig
+from pyjarvis_shared import AppConfig, default_config
 
 
 class OllamaClient:
@@ -19,7 +19,7 @@ class OllamaClient:
         Args:
             config: Application configuration (optional)
         """
-        self.config = config or AppConfig()
+        self.config = config or default_config()
         self.base_url = getattr(self.config, 'ollama_base_url', 'http://localhost:11434')
         self.model = getattr(self.config, 'ollama_model', 'llama3.2')
         self._session: Optional[aiohttp.ClientSession] = None
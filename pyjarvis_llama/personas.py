@@ -5,10 +5,27 @@ Improved: shared style/safety rules, tighter prompt blocks, TTS-friendly output,
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Dict, Type
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping, Optional, Tuple, Type
 from loguru import logger
 
 
+# ------------ Prompt tags ------------
+
+_PERSONA_OPEN: Final[str] = "<persona>\n"
+_PERSONA_TO_CONTEXT: Final[str] = "\n</persona>\n\n<context>\n"
+_CONTEXT_CLOSE: Final[str] = "\n</context>"
+_STYLE_OPEN: Final[str] = "<style>\n"
+_STYLE_TO_SAFETY: Final[str] = "\n</style>\n\n<safety>\n"
+_SAFETY_TO_OUTPUT: Final[str] = "\n</safety>\n\n<output>\n"
+_OUTPUT_CLOSE: Final[str] = "\n</output>"
+_MEMORY_OPEN: Final[str] = "<memory>\n"
+_MEMORY_CLOSE: Final[str] = "\n</memory>"
+_USER_OPEN: Final[str] = "<user>\n"
+_USER_CLOSE: Final[str] = "\n</user>"
+_BLOCK_SEPARATOR: Final[str] = "\n\n"
+
+
 # ------------ Base Strategy ------------
 
 class PersonaStrategy(ABC):
@@ -65,19 +82,39 @@ class PersonaStrategy(ABC):
         )
 
     # ---- Prompt builder ----
-    def build_prompt(self, user_input: str) -> str:
+    def build_blocks(
+        self, user_input: str, memory_snippets: Optional[List[str]] = None
+    ) -> List[Tuple[str, str, bool]]:
+        """
+        Build the prompt as ordered (name, content, cacheable) blocks.
+
+        Static blocks come first so the prompt prefix stays byte-identical across
+        turns (provider prompt/KV caches only reuse a shared prefix); per-turn
+        content (recalled memory, user input) is kept at the end.
+        """
+        blocks = [
+            ("persona",
+             "".join((_PERSONA_OPEN, self.persona, _PERSONA_TO_CONTEXT, self.context, _CONTEXT_CLOSE)),
+             True),
+            ("style",
+             "".join((
+                 _STYLE_OPEN, self.style_guidelines,
+                 _STYLE_TO_SAFETY, self.safety_rules,
+                 _SAFETY_TO_OUTPUT, self.output_definition, _OUTPUT_CLOSE,
+             )),
+             True),
+        ]
+        if memory_snippets:
+            memory = _BLOCK_SEPARATOR.join(memory_snippets)
+            blocks.append(("memory", "".join((_MEMORY_OPEN, memory, _MEMORY_CLOSE)), False))
+        blocks.append(("user", "".join((_USER_OPEN, user_input, _USER_CLOSE)), False))
+        return blocks
+
+    def build_prompt(self, user_input: str, memory_snippets: Optional[List[str]] = None) -> str:
         """
         Build prompt with consistent sections to improve determinism and TTS quality.
         """
-        prompt = (
-            f"<persona>\n{self.persona}\n</persona>\n\n"
-            f"<context>\n{self.context}\n</context>\n\n"
-            f"<style>\n{self.style_guidelines}\n</style>\n\n"
-            f"<safety>\n{self.safety_rules}\n</safety>\n\n"
-            f"<output>\n{self.output_definition}\n</output>\n\n"
-            f"<user>\n{user_input}\n</user>"
-        )
-        return prompt
+        return _BLOCK_SEPARATOR.join(content for _, content, _ in self.build_blocks(user_input, memory_snippets))
 
 
 # ------------ Personas ------------
@@ -261,13 +298,19 @@ class RedQueenPersona(PersonaStrategy):
 class PersonaFactory:
     """Factory for creating persona instances"""
 
-    _personas: Dict[str, Type[PersonaStrategy]] = {
+    # Read-only registry; register() swaps in a rebuilt proxy
+    _personas: Mapping[str, Type[PersonaStrategy]] = MappingProxyType({
         "jarvis": JarvisPersona,
         "friendly": FriendlyPersona,
         "professional": ProfessionalPersona,
         "portuguese": PortuguesePersona,
         "red_queen": RedQueenPersona,
         "catalina": CatalinaPersona,
+    })
+
+    # Personas are stateless, so one shared instance per name is handed out
+    _instances: Dict[str, PersonaStrategy] = {
+        key: persona_cls() for key, persona_cls in _personas.items()
     }
 
     @classmethod
@@ -276,12 +319,14 @@ class PersonaFactory:
         Create a persona instance by name
         """
         key = (persona_name or "").lower().strip()
-        if key not in cls._personas:
-            logger.warning(f"Unknown persona '{persona_name}', defaulting to 'jarvis'")
-            key = "jarvis"
-
-        persona_cls = cls._personas[key]
-        instance = persona_cls()
+        instance = cls._instances.get(key)
+        if instance is None:
+            persona_cls = cls._personas.get(key)
+            if persona_cls is None:
+                logger.warning(f"Unknown persona '{persona_name}', defaulting to 'jarvis'")
+                instance = cls._instances["jarvis"]
+            else:
+                instance = cls._instances[key] = persona_cls()
         logger.debug(f"Created persona: {instance.name}")
         return instance
 
@@ -292,5 +337,6 @@ class PersonaFactory:
     @classmethod
     def register(cls, name: str, persona_class: Type[PersonaStrategy]) -> None:
         key = name.lower().strip()
-        cls._personas[key] = persona_class
+        cls._personas = MappingProxyType({**cls._personas, key: persona_class})
+        cls._instances.pop(key, None)
         logger.info(f"Registered persona: {name}")
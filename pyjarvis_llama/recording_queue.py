@@ -3,9 +3,13 @@ Audio Recording Queue - Processamento em fila para gravação e transcrição
 Aplica princípios de Clean Code e Refatoração (Martin Fowler)
 """
 
+import asyncio
 import queue
 import threading
 import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Callable
@@ -15,6 +19,15 @@ from pyjarvis_shared import AppConfig
 from .audio_recorder import AudioRecorder
 
 
+# Module-level bindings for names used on every task/status transition
+_time_time = time.time
+_Event = threading.Event
+_uuid4 = uuid.uuid4
+
+# Callback padrão: permite chamar os callbacks sem checar None a cada evento
+_NOOP: Callable[..., None] = lambda *args, **kwargs: None
+
+
 class RecordingStatus(Enum):
     """Status da gravação"""
     PENDING = "pending"
@@ -31,13 +44,42 @@ class RecordingTask:
     task_id: str
     config: AppConfig
     language: str
-    on_status_update: Optional[Callable[[RecordingStatus], None]] = None
-    on_text_chunk: Optional[Callable[[str], None]] = None
+    on_status_update: Callable[[RecordingStatus], None] = _NOOP
+    on_text_chunk: Callable[[str], None] = _NOOP
     created_at: float = 0.0
     
     def __post_init__(self):
+        # Callers may still pass None explicitly
+        if self.on_status_update is None:
+            self.on_status_update = _NOOP
+        if self.on_text_chunk is None:
+            self.on_text_chunk = _NOOP
         if self.created_at == 0.0:
-            self.created_at = time.time()
+            self.created_at = _time_time()
+
+
+class _ChunkDeduplicator:
+    """
+    Detecta chunks de transcrição repetidos
+    Guarda o texto normalizado dos últimos chunks (janela FIFO limitada), então o custo
+    não cresce com o tamanho da transcrição e chunks diferentes nunca são confundidos
+    """
+    
+    def __init__(self, window: int = 4096):
+        self._seen: set[str] = set()
+        self._order: deque[str] = deque()
+        self._window = window
+    
+    def is_duplicate(self, text: str) -> bool:
+        """Retorna True se o chunk já foi visto recentemente (e registra os novos)"""
+        key = text.lower()
+        if key in self._seen:
+            return True
+        self._seen.add(key)
+        self._order.append(key)
+        if len(self._order) > self._window:
+            self._seen.discard(self._order.popleft())
+        return False
 
 
 @dataclass
@@ -109,8 +151,7 @@ class AudioRecordingQueue:
         Returns:
             ID da tarefa
         """
-        import uuid
-        task_id = str(uuid.uuid4())
+        task_id = str(_uuid4())
         
         task = RecordingTask(
             task_id=task_id,
@@ -203,19 +244,18 @@ class AudioRecordingQueue:
         Returns:
             Resultado da gravação
         """
-        start_time = time.time()
+        start_time = _time_time()
         
         try:
             # Update status: initializing
-            if task.on_status_update:
-                task.on_status_update(RecordingStatus.INITIALIZING)
+            task.on_status_update(RecordingStatus.INITIALIZING)
             
             # Create recorder
             recorder = AudioRecorder(config=task.config, language=task.language)
             
             # Create stop event and register it
-            stop_event = threading.Event()
-            started_event = threading.Event()
+            stop_event = _Event()
+            started_event = _Event()
             
             with self._active_recordings_lock:
                 self._active_recordings[task.task_id] = stop_event
@@ -223,33 +263,26 @@ class AudioRecordingQueue:
             try:
                 # Wrapper para capturar resultado
                 result_container = {"text": "", "error": None, "audio_path": None}
+                dedup = _ChunkDeduplicator()
                 
                 def on_transcription_chunk(text: str) -> None:
                     """Callback para chunks de transcrição"""
                     if text and text.strip():
-                        # Accumulate text (may receive multiple chunks)
-                        current_text = result_container["text"]
+                        # Accumulate text (may receive multiple chunks), skipping duplicates
                         new_text = text.strip()
-                        if current_text:
-                            # Combine chunks, avoiding duplicates
-                            if new_text not in current_text:
-                                result_container["text"] = f"{current_text} {new_text}".strip()
-                            else:
-                                result_container["text"] = current_text  # Keep existing if duplicate
-                        else:
-                            result_container["text"] = new_text
-                        if task.on_text_chunk:
-                            task.on_text_chunk(text.strip())
+                        if not dedup.is_duplicate(new_text):
+                            current_text = result_container["text"]
+                            result_container["text"] = f"{current_text} {new_text}" if current_text else new_text
+                        task.on_text_chunk(new_text)
                 
                 # Update status: recording
-                if task.on_status_update:
-                    task.on_status_update(RecordingStatus.RECORDING)
+                task.on_status_update(RecordingStatus.RECORDING)
                 
                 # Record audio (synchronous call, but internally uses threads)
                 transcribed_text = recorder.record_until_stop(
                     stop_event=stop_event,
                     started_event=started_event,
-                    on_text_chunk=on_transcription_chunk if task.on_text_chunk else None
+                    on_text_chunk=on_transcription_chunk if task.on_text_chunk is not _NOOP else None
                 )
                 logger.debug(f"[RecordingQueue] recorder.record_until_stop returned: '{transcribed_text}'")
             finally:
@@ -258,8 +291,7 @@ class AudioRecordingQueue:
                     self._active_recordings.pop(task.task_id, None)
             
             # Update status: processing
-            if task.on_status_update:
-                task.on_status_update(RecordingStatus.PROCESSING)
+            task.on_status_update(RecordingStatus.PROCESSING)
             
             # Use the transcribed text (from parameter or container)
             # Prioritize the returned text, then container
@@ -283,7 +315,7 @@ class AudioRecordingQueue:
                         logger.debug(f"[RecordingQueue] Got container text after wait (attempt {attempt+1}): {final_text}")
                         break
             
-            duration = time.time() - start_time
+            duration = _time_time() - start_time
             
             # Get audio file path if available
             audio_path = None
@@ -306,17 +338,15 @@ class AudioRecordingQueue:
                 logger.info(f"[RecordingQueue] Result stored for task {task.task_id}: text_length={len(final_text or '')}, success={result.success}")
             
             # Update status: completed (only after result is stored)
-            if task.on_status_update:
-                task.on_status_update(RecordingStatus.COMPLETED)
+            task.on_status_update(RecordingStatus.COMPLETED)
             
             return result
             
         except Exception as e:
             logger.error(f"[RecordingQueue] Task {task.task_id} failed: {e}")
-            duration = time.time() - start_time
+            duration = _time_time() - start_time
             
-            if task.on_status_update:
-                task.on_status_update(RecordingStatus.FAILED)
+            task.on_status_update(RecordingStatus.FAILED)
             
             return RecordingResult(
                 task_id=task.task_id,
@@ -326,8 +356,77 @@ class AudioRecordingQueue:
             )
 
 
-# Singleton instance
+class AsyncAudioRecordingQueue(AudioRecordingQueue):
+    """
+    Fila de gravação assíncrona
+    Executa a gravação (bloqueante) em um executor dedicado e entrega o resultado
+    diretamente via await, sem worker thread nem polling de get_result
+    """
+    
+    def __init__(self, executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Inicializa a fila de gravação assíncrona
+        
+        Args:
+            executor: Executor para as gravações (padrão: um único worker, gravações em série)
+        """
+        super().__init__()
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="recording")
+    
+    def create_task(
+        self,
+        config: AppConfig,
+        language: str,
+        on_status_update: Optional[Callable[[RecordingStatus], None]] = None,
+        on_text_chunk: Optional[Callable[[str], None]] = None
+    ) -> RecordingTask:
+        """
+        Cria uma tarefa de gravação (o task_id já pode ser usado em stop_recording)
+        
+        Args:
+            config: Configuração da aplicação
+            language: Idioma para reconhecimento de voz
+            on_status_update: Callback para atualizações de status
+            on_text_chunk: Callback para chunks de texto transcrito
+            
+        Returns:
+            Tarefa de gravação
+        """
+        return RecordingTask(
+            task_id=str(_uuid4()),
+            config=config,
+            language=language,
+            on_status_update=on_status_update,
+            on_text_chunk=on_text_chunk
+        )
+    
+    async def submit(self, task: RecordingTask) -> RecordingResult:
+        """
+        Executa uma tarefa de gravação e aguarda o resultado
+        
+        Args:
+            task: Tarefa de gravação
+            
+        Returns:
+            Resultado da gravação
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, self._process_recording_task, task)
+        finally:
+            # The result is handed back directly, no need to keep it for get_result()
+            with self._result_lock:
+                self._result_store.pop(task.task_id, None)
+    
+    def shutdown(self) -> None:
+        """Libera o executor de gravação"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.debug("[RecordingQueue] Executor shut down")
+
+
+# Singleton instances
 _recording_queue: Optional[AudioRecordingQueue] = None
+_async_recording_queue: Optional[AsyncAudioRecordingQueue] = None
 
 
 def get_recording_queue() -> AudioRecordingQueue:
@@ -338,3 +437,18 @@ def get_recording_queue() -> AudioRecordingQueue:
         _recording_queue.start()
     return _recording_queue
 
+
+def get_async_recording_queue() -> AsyncAudioRecordingQueue:
+    """Obtém instância singleton da fila de gravação assíncrona"""
+    global _async_recording_queue
+    if _async_recording_queue is None:
+        _async_recording_queue = AsyncAudioRecordingQueue()
+    return _async_recording_queue
+
+
+def shutdown_async_recording_queue() -> None:
+    """Libera a fila de gravação assíncrona, se criada (a próxima chamada cria outra)"""
+    global _async_recording_queue
+    if _async_recording_queue is not None:
+        _async_recording_queue.shutdown()
+        _async_recording_queue = None
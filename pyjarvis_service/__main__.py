@@ -11,7 +11,8 @@ if __name__ == "__main__":
     logger.add(
         sys.stdout,
         level="INFO",
-        format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>"
+        format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
+        enqueue=True  # Format and write on loguru's worker thread, off the event loop
     )
     
     try:
@@ -2,17 +2,37 @@
 Text processing orchestration
 """
 
+import asyncio
+from collections import OrderedDict
 from pathlib import Path
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
 from loguru import logger
 from pyjarvis_shared import (
     TextToVoiceRequest,
     VoiceProcessingUpdate,
     ProcessingStatus,
+    Emotion,
     Language,
     AppConfig,
+    default_config,
 )
 from pyjarvis_core import TextAnalyzer
 from pyjarvis_core.tts_factory import TtsProcessorFactory
+from pyjarvis_core.tts_processors.base import TtsProcessorResult
+from .request_pool import PoolItem, RequestPool
+
+
+# Accepted request language codes/aliases (lowercase) -> Language
+_LANG_CODE_MAP: Mapping[str, Language] = MappingProxyType({
+    **dict.fromkeys(("pt-br", "pt", "portuguese"), Language.PORTUGUESE),
+    **dict.fromkeys(("es", "es-es", "es-mx", "espanol", "spanish", "español"), Language.SPANISH),
+    **dict.fromkeys(("en", "en-us", "en-gb", "english"), Language.ENGLISH),
+})
+
+_ANALYSIS_CACHE_SIZE = 1024  # Recent (text, language) analyses kept, least recently used evicted
+_MAX_BATCH = 8  # Requests per pipeline batch
+_TTS_BATCH_WINDOW = 0.025  # Seconds the TTS step waits for more requests to synthesize together
 
 
 class TextProcessor:
@@ -20,12 +40,24 @@ class TextProcessor:
     
     def __init__(self, config: AppConfig = None):
         """Create a new text processor"""
-        self.config = config or AppConfig()
+        self.config = config or default_config()
         self.text_analyzer = TextAnalyzer()
         
         # Create TTS processor using factory
-        output_dir = Path(self.config.audio_output_dir).resolve()
-        self.tts_processor = TtsProcessorFactory.create(self.config, output_dir)
+        # The output directory is resolved once here; processors build file paths from it
+        self._output_dir = Path(self.config.audio_output_dir).resolve()
+        self.tts_processor = TtsProcessorFactory.create(self.config, self._output_dir)
+        
+        # Analysis is a pure function of the text and requested language, so repeats
+        # (greetings, wake words) are answered from an LRU cache
+        self._analysis_cache: "OrderedDict[Tuple[str, Optional[str]], Tuple[Emotion, Language, Optional[str]]]" = OrderedDict()
+        
+        # Concurrent requests are batched per pipeline module: analysis, then TTS
+        self._pool = RequestPool(
+            [self._analyze_batch, self._synthesize_batch],
+            max_batch=_MAX_BATCH,
+            batch_windows=[0.0, _TTS_BATCH_WINDOW]
+        )
     
     async def initialize(self) -> None:
         """Initialize the processor and TTS engine"""
@@ -35,6 +67,10 @@ class TextProcessor:
         logger.debug("TTS processor initialized")
         logger.debug("Text processor initialized successfully")
     
+    def close(self) -> None:
+        """Stop the request pool and cancel requests still in flight"""
+        self._pool.close()
+    
     async def process(self, request: TextToVoiceRequest) -> VoiceProcessingUpdate:
         """
         Process text to voice
@@ -46,44 +82,81 @@ class TextProcessor:
             Voice processing update with audio data
         """
         logger.info("[PIPELINE] Starting text processing pipeline")
-        logger.info(f"[PIPELINE] Input text: '{request.text}'")
-        logger.debug(f"[PIPELINE] Request language: {request.language}")
-        
-        # Step 1: Analyze text
-        logger.debug("[PIPELINE] Step 1: Analyzing text...")
-        emotion = await self.text_analyzer.detect_emotion(request.text)
-        logger.debug(f"[PIPELINE] Detected emotion: {emotion}")
+        logger.info("[PIPELINE] Input text: '{}'", request.text)
+        logger.debug("[PIPELINE] Request language: {}", request.language)
         
-        # Detect or use provided language
-        if request.language:
-            lang_code = request.language.lower()
-            if lang_code in ["pt-br", "pt", "portuguese"]:
-                language = Language.PORTUGUESE
-            elif lang_code in ["es", "es-es", "es-mx", "espanol", "spanish", "español"]:
-                language = Language.SPANISH
-            elif lang_code in ["en", "en-us", "en-gb", "english"]:
-                language = Language.ENGLISH
-            else:
-                # If language code is provided but not recognized, try to detect from text
-                logger.warning(f"[PIPELINE] Unknown language code '{lang_code}', detecting from text")
-                language = await self.text_analyzer.detect_language(request.text)
-        else:
-            language = await self.text_analyzer.detect_language(request.text)
+        update = await self._pool.submit(request)
         
-        logger.info(f"[PIPELINE] Detected language: {language.value}")
+        logger.info("[PIPELINE] Text processing complete")
+        return update
+    
+    async def _analyze_batch(self, items: List[PoolItem]) -> list:
+        """Step 1 for a batch of pool items: analyze each request's text"""
+        return await asyncio.gather(*(self._analyze(item.request) for item in items), return_exceptions=True)
+    
+    async def _synthesize_batch(self, items: List[PoolItem]) -> list:
+        """Step 2 for a batch of pool items: generate speech for all of them in one TTS call"""
+        logger.debug("[PIPELINE] Step 2: Generating speech...")
+        analyses = [item.state for item in items]
+        logger.info("[PIPELINE] Generating speech for {} request(s)", len(items))
+        results = await self.tts_processor.synthesize_batch(
+            [item.request.text for item in items],
+            [language for _, language, _ in analyses]
+        )
+        return [
+            result if isinstance(result, BaseException) else self._make_update(result, analysis)
+            for result, analysis in zip(results, analyses)
+        ]
+    
+    async def _analyze(self, request: TextToVoiceRequest) -> Tuple[Emotion, Language, Optional[str]]:
+        """
+        Analyze text (emotion, language and subject are independent)
         
-        subject = await self.text_analyzer.extract_subject(request.text)
-        logger.debug(f"[PIPELINE] Extracted subject: {subject}")
+        Args:
+            request: Text processing request
+            
+        Returns:
+            Tuple of (emotion, language, subject)
+        """
+        logger.debug("[PIPELINE] Step 1: Analyzing text...")
+        key = (request.text, request.language)
+        analysis = self._analysis_cache.get(key)
+        if analysis is not None:
+            self._analysis_cache.move_to_end(key)
+            logger.debug("[PIPELINE] Analysis cache hit")
+            return analysis
         
-        # Step 2: Generate speech
-        logger.debug("[PIPELINE] Step 2: Generating speech...")
-        logger.info(f"[PIPELINE] Generating speech for language: {language}")
+        emotion, language, subject = await asyncio.gather(
+            self.text_analyzer.detect_emotion(request.text),
+            self._resolve_language(request),
+            self.text_analyzer.extract_subject(request.text),
+        )
+        logger.debug("[PIPELINE] Detected emotion: {}", emotion)
+        logger.info("[PIPELINE] Detected language: {}", language.value)
+        logger.debug("[PIPELINE] Extracted subject: {}", subject)
         
-        # Generate audio file using TTS processor
-        result = await self.tts_processor.synthesize(request.text, language)
-        logger.info(f"[PIPELINE] Generated audio file: {result.audio_file_path}")
+        self._analysis_cache[key] = analysis = (emotion, language, subject)
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        return analysis
+    
+    def _make_update(
+        self,
+        result: TtsProcessorResult,
+        analysis: Tuple[Emotion, Language, Optional[str]]
+    ) -> VoiceProcessingUpdate:
+        """
+        Build the update for a synthesized request
         
-        logger.info("[PIPELINE] Text processing complete")
+        Args:
+            result: TTS result for the request
+            analysis: Result of _analyze for the request
+            
+        Returns:
+            Voice processing update with audio file path
+        """
+        emotion, _, subject = analysis
+        logger.info("[PIPELINE] Generated audio file: {}", result.audio_file_path)
         
         # Return update with file path (not bytes)
         return VoiceProcessingUpdate(
@@ -92,4 +165,27 @@ class TextProcessor:
             emotion=emotion,
             subject=subject,
         )
-
+    
+    async def _resolve_language(self, request: TextToVoiceRequest) -> Language:
+        """
+        Resolve the request's language code, detecting it from the text if needed
+        
+        Args:
+            request: Text processing request
+            
+        Returns:
+            Language to synthesize in
+        """
+        language = None
+        if request.language:
+            # Canonical values ("Portuguese") hit the enum's value map; codes and aliases go through the table
+            language = (
+                Language._value2member_map_.get(request.language)
+                or _LANG_CODE_MAP.get(request.language.lower())
+            )
+        if language is None:
+            if request.language:
+                # If language code is provided but not recognized, try to detect from text
+                logger.warning("[PIPELINE] Unknown language code '{}', detecting from text", request.language)
+            language = await self.text_analyzer.detect_language(request.text)
+        return language
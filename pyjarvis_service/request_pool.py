@@ -0,0 +1,184 @@
+"""
+Request pool with per-module dynamic batching for the text-to-voice pipeline
+"""
+
+import asyncio
+import itertools
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set
+from loguru import logger
+from pyjarvis_shared import TextToVoiceRequest
+
+
+@dataclass
+class PoolItem:
+    """An in-flight request and its position in the pipeline"""
+    request: TextToVoiceRequest
+    future: asyncio.Future
+    module_idx: int = 0  # Index of the pipeline module this item is waiting for
+    state: Any = None  # Output of the previous module
+
+
+# A module takes a batch of items and returns one result (or exception) per item
+BatchModule = Callable[[List[PoolItem]], Awaitable[List[Any]]]
+
+
+class RequestPool:
+    """
+    In-memory pool of in-flight requests, advanced through the pipeline in batches
+
+    Each pipeline module (e.g. text analysis, then TTS) works on one batch at a
+    time. Whenever a module is idle, the pool items waiting for it (up to
+    max_batch) are taken as its next batch, so requests that arrive together
+    are processed together and a busy module never holds up the others.
+
+    A module can also be given a batch window: once an item is waiting, the
+    module waits up to that long (or until max_batch items are waiting) for
+    more to arrive before it runs.
+    """
+
+    def __init__(
+        self,
+        modules: Sequence[BatchModule],
+        max_batch: Optional[int] = None,
+        batch_windows: Optional[Sequence[float]] = None
+    ):
+        """
+        Create a new request pool
+
+        Args:
+            modules: Pipeline modules in order; the last module's result resolves the request
+            max_batch: Maximum number of items per batch (None for no limit)
+            batch_windows: Seconds each module waits to collect a batch (default: no wait)
+        """
+        self._modules = list(modules)
+        self._max_batch = max_batch
+        self._batch_windows = list(batch_windows) if batch_windows else [0.0] * len(self._modules)
+        self.pool_items: Dict[int, PoolItem] = {}
+        self._ids = itertools.count()
+        self._busy = [False] * len(self._modules)
+        self._filled: List[Optional[asyncio.Event]] = [None] * len(self._modules)  # Set when a window's batch is full
+        self._batches: Set[asyncio.Task] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, request: TextToVoiceRequest) -> Any:
+        """
+        Add a request to the pool and wait for it to leave the last module
+
+        Args:
+            request: Text processing request
+
+        Returns:
+            Result of the last pipeline module
+        """
+        loop = asyncio.get_running_loop()
+        self._ensure_running(loop)
+
+        req_id = next(self._ids)
+        item = PoolItem(request=request, future=loop.create_future())
+        # Drop the item as soon as its caller stops waiting, so it never joins a batch
+        item.future.add_done_callback(lambda future: future.cancelled() and self.pool_items.pop(req_id, None))
+        self.pool_items[req_id] = item
+        self._wakeup.set()
+        return await item.future
+
+    def _ensure_running(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the scheduler on the current loop if it isn't running there"""
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            return
+        # Items submitted on a previous loop can no longer be scheduled; fail them instead of leaving callers hanging
+        for item in self.pool_items.values():
+            if not item.future.done() and not item.future.get_loop().is_closed():
+                item.future.set_exception(RuntimeError("Request pool restarted on another event loop"))
+        self.pool_items.clear()
+        self._busy = [False] * len(self._modules)
+        self._filled = [None] * len(self._modules)
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self.run_forever())
+
+    async def run_forever(self) -> None:
+        """Dispatch a batch to every idle module that has items waiting"""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            waiting = Counter(item.module_idx for item in self.pool_items.values())
+            for module_idx, busy in enumerate(self._busy):
+                if busy:
+                    # Cut a batch window short once the batch is full
+                    filled = self._filled[module_idx]
+                    if filled is not None and self._is_full(waiting[module_idx]):
+                        filled.set()
+                    continue
+                if not waiting[module_idx]:
+                    continue
+                self._busy[module_idx] = True
+                if self._batch_windows[module_idx] > 0 and not self._is_full(waiting[module_idx]):
+                    batch = None  # Collected when the window closes
+                else:
+                    batch = self._collect_batch(module_idx)
+                task = asyncio.create_task(self._run_batch(module_idx, batch))
+                self._batches.add(task)
+                task.add_done_callback(self._batches.discard)
+
+    def _is_full(self, count: int) -> bool:
+        """Whether count waiting items make a full batch"""
+        return self._max_batch is not None and count >= self._max_batch
+
+    def _collect_batch(self, module_idx: int) -> List[tuple]:
+        """Take up to max_batch (req_id, item) pairs waiting for a module"""
+        return list(itertools.islice(
+            ((req_id, item) for req_id, item in self.pool_items.items() if item.module_idx == module_idx),
+            self._max_batch
+        ))
+
+    async def _run_batch(self, module_idx: int, batch: Optional[List[tuple]]) -> None:
+        """Run one module over a batch (collected after its window if None) and advance or resolve its items"""
+        if batch is None:
+            filled = self._filled[module_idx] = asyncio.Event()
+            try:
+                await asyncio.wait_for(filled.wait(), self._batch_windows[module_idx])
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._filled[module_idx] = None
+            batch = self._collect_batch(module_idx)
+
+        logger.debug("[PIPELINE] Module {}: batch of {} request(s)", module_idx, len(batch))
+        try:
+            results = await self._modules[module_idx]([item for _, item in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        is_last = module_idx == len(self._modules) - 1
+        for (req_id, item), result in zip(batch, results):
+            if item.future.done():
+                # Caller stopped waiting (e.g. client disconnected)
+                self.pool_items.pop(req_id, None)
+            elif isinstance(result, asyncio.CancelledError):
+                self.pool_items.pop(req_id, None)
+                item.future.cancel()
+            elif isinstance(result, BaseException):
+                self.pool_items.pop(req_id, None)
+                item.future.set_exception(result)
+            elif is_last:
+                self.pool_items.pop(req_id, None)
+                item.future.set_result(result)
+            else:
+                item.state = result
+                item.module_idx += 1
+
+        self._busy[module_idx] = False
+        self._wakeup.set()
+
+    def close(self) -> None:
+        """Stop the scheduler and cancel batches in progress"""
+        if self._task is not None:
+            self._task.cancel()
+        for task in list(self._batches):
+            task.cancel()
+        for item in self.pool_items.values():
+            item.future.cancel()
+        self.pool_items.clear()
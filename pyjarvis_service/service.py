@@ -14,8 +14,8 @@ async def run_service() -> None:
     logger.debug("Creating text processor...")
     
     # Initialize text processor with config
-    from pyjarvis_shared import AppConfig
-    config = AppConfig()
+    from pyjarvis_shared import default_config
+    config = default_config()
     processor = TextProcessor(config)
     await processor.initialize()
     logger.debug("Text processor initialized successfully")
@@ -29,11 +29,12 @@ async def run_service() -> None:
         await ipc_server.start(processor)
     except KeyboardInterrupt:
         logger.info("Service interrupted by user")
-        ipc_server.stop()
     except Exception as e:
-        logger.error(f"Service error: {e}")
-        ipc_server.stop()
+        logger.error("Service error: {}", e)
         raise
+    finally:
+        # Also runs when asyncio.run() cancels the task on Ctrl+C
+        ipc_server.stop()
     
     logger.info("Service started successfully")
     logger.info("Service is running. Press Ctrl+C to stop.")
@@ -48,7 +49,8 @@ if __name__ == "__main__":
     logger.add(
         sys.stdout,
         level="DEBUG",
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>"
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
+        enqueue=True  # Format and write on loguru's worker thread, off the event loop
     )
     
     # Run service
@@ -11,7 +11,8 @@ from .messages import (
     ServiceCommand,
     ServiceResponse,
 )
-from .config import AudioConfig, AppConfig
+from .config import AudioConfig, AppConfig, default_config
+from .framing import pack_frame, unpack_payload, read_payload
 
 __all__ = [
     "TextToVoiceRequest",
@@ -23,5 +24,9 @@ __all__ = [
     "ServiceResponse",
     "AudioConfig",
     "AppConfig",
+    "default_config",
+    "pack_frame",
+    "unpack_payload",
+    "read_payload",
 ]
 
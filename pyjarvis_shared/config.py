@@ -3,10 +3,26 @@ Configuration structures
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Mapping
 
 
-@dataclass
+# Default Edge-TTS voice mapping by language code, shared read-only by all configs
+_DEFAULT_EDGE_TTS_VOICES: Mapping[str, str] = MappingProxyType({
+    "pt-br": "pt-BR-LeilaNeural",
+    "pt": "pt-BR-LeilaNeural",
+    "en": "en-US-AnaNeural",
+    "en-us": "en-US-AnaNeural",
+    "es": "es-ES-ElviraNeural",
+    "es-es": "es-ES-ElviraNeural",
+    "es-mx": "es-MX-DaliaNeural",
+    "es-ar": "es-AR-ElenaNeural",
+    "es-co": "es-CO-SalomeNeural"
+})
+
+
+@dataclass(frozen=True, slots=True)
 class AudioConfig:
     """Audio configuration"""
     sample_rate: int = 44100
@@ -15,7 +31,7 @@ class AudioConfig:
     format: str = "int16"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application configuration"""
     pipe_name: str = r"\\.\pipe\pyjarvis"  # Legacy, kept for compatibility
@@ -38,21 +54,22 @@ class AppConfig:
     stt_language: str = "en"  # Default language for speech-to-text (en, pt, es, fr, de, it, etc.)
     
     # Edge-TTS Configuration
-    edge_tts_voices: Dict[str, str] = field(default_factory=lambda: {
-        "pt-br": "pt-BR-LeilaNeural",
-        "pt": "pt-BR-LeilaNeural",
-        "en": "en-US-AnaNeural",
-        "en-us": "en-US-AnaNeural",
-        "es": "es-ES-ElviraNeural",
-        "es-es": "es-ES-ElviraNeural",
-        "es-mx": "es-MX-DaliaNeural",
-        "es-ar": "es-AR-ElenaNeural",
-        "es-co": "es-CO-SalomeNeural"
-    })  # Voice mapping by language code
+    edge_tts_voices: Mapping[str, str] = field(default_factory=lambda: _DEFAULT_EDGE_TTS_VOICES)  # Voice mapping by language code
     # for a complete list of voices, execute the following command:
     # edge-tts --list-voices
     
     def __post_init__(self):
         if self.audio_config is None:
-            self.audio_config = AudioConfig()
+            object.__setattr__(self, "audio_config", AudioConfig())
 
+
+@lru_cache(maxsize=1)
+def default_config() -> AppConfig:
+    """
+    Shared default-constructed AppConfig
+    
+    Use this instead of AppConfig() when only defaults are needed. Configs are
+    frozen, so the shared instance cannot be changed; derive variants with
+    dataclasses.replace().
+    """
+    return AppConfig()
@@ -0,0 +1,88 @@
+"""
+Wire framing for IPC payloads
+
+Every message is sent as a 4-byte little-endian length prefix followed by a payload.
+A payload is either a plain JSON document (it starts with '{') or, when raw audio
+travels with it, a binary frame:
+
+    <B version> <I json_len> <json envelope> <raw audio bytes>
+"""
+
+import asyncio
+import struct
+from typing import Optional, Tuple
+
+BINARY_FRAME_VERSION = 1
+SPLIT_READ_SIZE = 64 * 1024  # Payloads from this size on are read envelope and audio separately
+
+_BINARY_HEADER = struct.Struct('<BI')
+_LENGTH_PREFIX = struct.Struct('<I')
+
+
+def pack_frame(json_bytes: bytes, audio_data: Optional[bytes] = None) -> bytes:
+    """
+    Build a complete wire frame (length prefix included)
+
+    Prefix, header, envelope and audio are joined in one pass, so raw audio is copied only once.
+
+    Args:
+        json_bytes: Serialized JSON envelope
+        audio_data: Optional raw audio sent after the envelope (not hex-encoded)
+
+    Returns:
+        Frame bytes, ready to be written to a stream
+    """
+    if not audio_data:
+        return b"".join((_LENGTH_PREFIX.pack(len(json_bytes)), json_bytes))
+    return b"".join((
+        _LENGTH_PREFIX.pack(_BINARY_HEADER.size + len(json_bytes) + len(audio_data)),
+        _BINARY_HEADER.pack(BINARY_FRAME_VERSION, len(json_bytes)),
+        json_bytes,
+        audio_data,
+    ))
+
+
+def unpack_payload(payload: bytes) -> Tuple[bytes, Optional[bytes]]:
+    """
+    Split a message payload into its JSON envelope and raw audio
+
+    Args:
+        payload: Payload bytes (without the length prefix)
+
+    Returns:
+        Tuple of (json_bytes, audio_data or None)
+    """
+    if not payload or payload[0] != BINARY_FRAME_VERSION:
+        return payload, None
+    _, json_len = _BINARY_HEADER.unpack_from(payload)
+    json_end = _BINARY_HEADER.size + json_len
+    if json_end > len(payload):
+        raise ValueError(f"Binary frame truncated: JSON envelope needs {json_len} bytes")
+    return payload[_BINARY_HEADER.size:json_end], payload[json_end:] or None
+
+
+async def read_payload(reader: asyncio.StreamReader, length: int) -> Tuple[bytes, Optional[bytes]]:
+    """
+    Read a payload from a stream, splitting it into its JSON envelope and raw audio
+
+    Large payloads are read in parts, so their raw audio lands in its own buffer instead of
+    being copied out of the whole payload; small ones are read in one go and split by unpack_payload().
+
+    Args:
+        reader: Stream positioned after the length prefix
+        length: Payload length from the prefix
+
+    Returns:
+        Tuple of (json_bytes, audio_data or None)
+    """
+    if length < SPLIT_READ_SIZE:
+        return unpack_payload(await reader.readexactly(length))
+    header = await reader.readexactly(_BINARY_HEADER.size)
+    if header[0] != BINARY_FRAME_VERSION:
+        return header + await reader.readexactly(length - _BINARY_HEADER.size), None
+    _, json_len = _BINARY_HEADER.unpack(header)
+    audio_len = length - _BINARY_HEADER.size - json_len
+    if audio_len < 0:
+        raise ValueError(f"Binary frame truncated: JSON envelope needs {json_len} bytes")
+    json_bytes = await reader.readexactly(json_len)
+    return json_bytes, (await reader.readexactly(audio_len) if audio_len else None)
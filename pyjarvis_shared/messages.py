@@ -5,7 +5,7 @@ IPC message types for communication between components
 from enum import Enum
 from typing import Optional
 from dataclasses import dataclass, field
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ProcessingStatus(str, Enum):
@@ -33,14 +33,14 @@ class Language(str, Enum):
     SPANISH = "Spanish"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TextToVoiceRequest:
     """Message sent from CLI to Service"""
     text: str
     language: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VoiceProcessingUpdate:
     """Message sent from Service to UI"""
     status: ProcessingStatus
@@ -51,14 +51,20 @@ class VoiceProcessingUpdate:
 
 
 class ServiceCommand(BaseModel):
-    """Service command messages"""
+    """
+    Service command messages
+    
+    The factory classmethods build from trusted, already-typed values and use
+    model_construct to skip validation; data from the wire goes through
+    model_validate_json.
+    """
     command_type: str
     request: Optional[dict] = None
     
     @classmethod
     def process_text(cls, request: TextToVoiceRequest) -> "ServiceCommand":
         """Create a ProcessText command"""
-        return cls(
+        return cls.model_construct(
             command_type="ProcessText",
             request={
                 "text": request.text,
@@ -69,34 +75,40 @@ class ServiceCommand(BaseModel):
     @classmethod
     def register_ui(cls) -> "ServiceCommand":
         """Create a RegisterUI command"""
-        return cls(command_type="RegisterUI")
+        return cls.model_construct(command_type="RegisterUI")
     
     @classmethod
     def shutdown(cls) -> "ServiceCommand":
         """Create a Shutdown command"""
-        return cls(command_type="Shutdown")
+        return cls.model_construct(command_type="Shutdown")
     
     @classmethod
     def ping(cls) -> "ServiceCommand":
         """Create a Ping command"""
-        return cls(command_type="Ping")
+        return cls.model_construct(command_type="Ping")
 
 
 class ServiceResponse(BaseModel):
-    """Service response messages"""
+    """
+    Service response messages
+    
+    Like ServiceCommand, the factory classmethods skip validation (model_construct).
+    """
     response_type: str
     update: Optional[dict] = None
     error: Optional[str] = None
+    # Raw audio travels after the JSON envelope in a binary frame, never inside it
+    audio_data: Optional[bytes] = Field(default=None, exclude=True)
     
     @classmethod
     def ack(cls) -> "ServiceResponse":
         """Create an Ack response"""
-        return cls(response_type="Ack")
+        return cls.model_construct(response_type="Ack")
     
     @classmethod
     def pong(cls) -> "ServiceResponse":
         """Create a Pong response"""
-        return cls(response_type="Pong")
+        return cls.model_construct(response_type="Pong")
     
     @classmethod
     def create_update(cls, update: VoiceProcessingUpdate) -> "ServiceResponse":
@@ -104,16 +116,6 @@ class ServiceResponse(BaseModel):
         # Convert status
         status_str = update.status.value if hasattr(update.status, 'value') else str(update.status)
         
-        # Convert audio_data to hex string if present
-        audio_data_hex = None
-        if update.audio_data:
-            try:
-                audio_data_hex = update.audio_data.hex()
-            except Exception as e:
-                # If conversion fails, log but continue
-                import logging
-                logging.warning(f"Failed to convert audio_data to hex: {e}")
-        
         # Convert emotion
         emotion_str = None
         if update.emotion:
@@ -126,17 +128,18 @@ class ServiceResponse(BaseModel):
         
         update_dict = {
             "status": status_str,
-            "audio_data": audio_data_hex,  # Deprecated, kept for backward compatibility
             "audio_file_path": audio_file_path,  # Preferred
             "emotion": emotion_str,
             "subject": update.subject,
         }
-        return cls(response_type="Update", update=update_dict)
+        # Raw audio rides in the binary frame, and only when there is no file to play instead
+        audio_data = None if audio_file_path else update.audio_data
+        return cls.model_construct(response_type="Update", update=update_dict, audio_data=audio_data)
     
     @classmethod
     def create_error(cls, error_msg: str) -> "ServiceResponse":
         """Create an Error response"""
-        return cls(response_type="Error", error=error_msg)
+        return cls.model_construct(response_type="Error", error=error_msg)
     
     # Keep old names for backward compatibility (but they won't work with Pydantic v2)
     # Use create_update and create_error instead
@@ -2,9 +2,31 @@
 Desktop UI with animated digital face using Pygame
 """
 
-from .app import PyJarvisApp
-from .audio_player import AudioPlayer
-from .face_renderer import FaceRenderer
-from .service_client import ServiceClient
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .app import PyJarvisApp
+    from .audio_player import AudioPlayer
+    from .face_renderer import FaceRenderer
+    from .service_client import ServiceClient
+
+# Exports are imported on first access so `import pyjarvis_ui` (or one of its
+# submodules) doesn't load pygame/SDL and the audio stack up front
+_EXPORTS = {
+    "PyJarvisApp": ".app",
+    "AudioPlayer": ".audio_player",
+    "FaceRenderer": ".face_renderer",
+    "ServiceClient": ".service_client",
+}
 
 __all__ = ["PyJarvisApp", "AudioPlayer", "FaceRenderer", "ServiceClient"]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,19 +2,40 @@
 Main Pygame application with animated digital face
 """
 
-import pygame
 import asyncio
 import sys
 import threading
 import os
-from typing import Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
 from loguru import logger
-from pyjarvis_core import AnimationController
-from pyjarvis_shared import VoiceProcessingUpdate, AppConfig
-from .face_renderer import FaceRenderer
-from .audio_player import AudioPlayer
+from pyjarvis_shared import VoiceProcessingUpdate, default_config
 from .service_client import ServiceClient
 
+if TYPE_CHECKING:
+    # pygame (SDL), the renderer and the audio stack are imported when the app is created
+    import pygame
+
+
+_SURFACE_CACHE_SIZE = 32  # Rendered text/background surfaces kept per cache
+_OUTGOING_QUEUE_SIZE = 32  # Texts waiting to be sent to the service
+_RECONNECT_MIN_DELAY = 1.0  # Seconds before the first reconnect retry, doubled per failure
+_RECONNECT_MAX_DELAY = 30.0
+_ACTIVE_FPS = 60  # While speaking, animating or typing
+_IDLE_FPS = 15  # Face at rest: only the slow ring pulse is moving
+
+
+def _cached_surface(cache: "OrderedDict", key: Tuple, factory: Callable[[], "pygame.Surface"]) -> "pygame.Surface":
+    """Return cache[key], creating it with factory and evicting the least recently used entry"""
+    surface = cache.get(key)
+    if surface is None:
+        surface = cache[key] = factory()
+        if len(cache) > _SURFACE_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return surface
+
 
 class PyJarvisApp:
     """Main PyJarvis application"""
@@ -27,6 +48,11 @@ class PyJarvisApp:
             width: Window width (if None, uses robot image dimensions)
             height: Window height (if None, uses robot image dimensions)
         """
+        import pygame
+        from pyjarvis_core import AnimationController
+        from .face_renderer import FaceRenderer
+        from .audio_player import AudioPlayer
+        
         # Load robot face image to determine window size
         robot_image_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "robot-face-2.png")
         
@@ -57,33 +83,59 @@ class PyJarvisApp:
         
         # Initialize Pygame
         pygame.init()
+        # Keep the module on the instance so the per-frame methods don't re-import it
+        self._pygame = pygame
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("PyJarvis - Your AI Assistant")
         self.clock = pygame.time.Clock()
         
+        # Connection indicator in center of bottom-left circle (window size is fixed)
+        # Based on image grid: bottom-left circle center is at grid (4.5, 13.5) of (27, 18) grid
+        # Original image: 524x600, so per grid unit: x=19.41, y=33.33
+        # Original position: (87, 450) scaled to current window size
+        original_img_width = 524
+        original_img_height = 600
+        grid_x_center = 4.5  # Center of bottom-left circle horizontally
+        grid_y_center = 13.5  # Center of bottom-left circle vertically
+        original_x = (grid_x_center / 25.5) * original_img_width
+        original_y = (grid_y_center / 18.81) * original_img_height
+        # Scale to current window size
+        scale_x = self.width / original_img_width
+        scale_y = self.height / original_img_height
+        self._dot_pos = (int(original_x * scale_x), int(original_y * scale_y))
+        
+        # Overlay text: the font is loaded once (on first use), rendered text and backgrounds are reused
+        self._font: Optional["pygame.font.Font"] = None
+        self._text_cache: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self._text_bg_cache: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        
         # Components
         self.animation_controller = AnimationController()
         self.face_renderer = FaceRenderer(self.width, self.height, robot_image_path)
         
         # Get config for audio player
-        config = AppConfig()
+        config = default_config()
         self.audio_player = AudioPlayer(
             delete_after_playback=config.audio_delete_after_playback
         )
         
         # Service client
         self.service_client = ServiceClient()
+        self.service_client.disconnect_callback = self._on_service_disconnected
         self.asyncio_thread: Optional[threading.Thread] = None
         self.asyncio_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_ready = threading.Event()  # Set by the asyncio thread once its loop exists
+        self._outgoing_queue: Optional[asyncio.Queue] = None  # Texts from the UI thread, sent in order
+        self._sender_task: Optional[asyncio.Task] = None
+        self._disconnect_event: Optional[asyncio.Event] = None  # Set when a (re)connect is needed
         
         # State
         self.running = True
         self.input_text = ""
         self.last_frame_time = pygame.time.get_ticks()
+        self._target_fps = _ACTIVE_FPS
         self.connected_to_service = False
         self.reconnect_future = None  # Future from run_coroutine_threadsafe
-        self.last_reconnect_attempt = 0.0
-        self.reconnect_interval = 3.0  # Try to reconnect every 3 seconds
         
         logger.info("PyJarvis UI initialized")
     
@@ -91,11 +143,16 @@ class PyJarvisApp:
         """Run asyncio event loop in a separate thread"""
         self.asyncio_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.asyncio_loop)
+        self._outgoing_queue = asyncio.Queue(maxsize=_OUTGOING_QUEUE_SIZE)
+        self._disconnect_event = asyncio.Event()
+        self._loop_ready.set()
         self.asyncio_loop.run_forever()
     
     async def _async_initialize(self) -> None:
         """Async initialization"""
-        await self._try_connect_to_service()
+        self._sender_task = asyncio.create_task(self._async_sender())
+        if not await self._try_connect_to_service():
+            self._disconnect_event.set()
     
     async def _try_connect_to_service(self) -> bool:
         """
@@ -126,26 +183,30 @@ class PyJarvisApp:
             self.connected_to_service = False
             return False
     
+    def _on_service_disconnected(self) -> None:
+        """Called by the service client (on the asyncio loop) when the connection is lost"""
+        logger.info("[UI] Detected connection loss, updating status...")
+        self.connected_to_service = False
+        self._disconnect_event.set()
+    
     async def _async_reconnect_loop(self) -> None:
-        """Background task to periodically try reconnecting to service"""
-        import time
+        """Background task that reconnects to the service after a disconnect, with exponential backoff"""
         while self.running:
-            # Check if connection status has changed (service might have disconnected)
-            if self.connected_to_service and not self.service_client.connected:
-                logger.info("[UI] Detected connection loss, updating status...")
-                self.connected_to_service = False
-            
-            if not self.connected_to_service:
-                current_time = time.time()
-                if current_time - self.last_reconnect_attempt >= self.reconnect_interval:
-                    self.last_reconnect_attempt = current_time
-                    logger.debug("Attempting to reconnect to service...")
-                    success = await self._try_connect_to_service()
-                    if success:
-                        logger.info("[UI] Successfully reconnected to service!")
+            # Sleep until the connection is lost (or the initial connect failed)
+            await self._disconnect_event.wait()
+            self._disconnect_event.clear()
+            if self.service_client.connected:
+                continue
             
-            # Sleep for a bit before checking again
-            await asyncio.sleep(1.0)  # Check every second
+            self.connected_to_service = False
+            delay = _RECONNECT_MIN_DELAY
+            while self.running:
+                logger.debug("Attempting to reconnect to service...")
+                if await self._try_connect_to_service():
+                    logger.info("[UI] Successfully reconnected to service!")
+                    break
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RECONNECT_MAX_DELAY)
     
     def _handle_update(self, update: VoiceProcessingUpdate) -> None:
         """
@@ -187,8 +248,22 @@ class PyJarvisApp:
         except Exception as e:
             logger.error(f"[UI] Failed to send text to service: {e}")
     
+    async def _async_sender(self) -> None:
+        """Send texts queued by the UI thread, one at a time in order"""
+        while True:
+            text = await self._outgoing_queue.get()
+            await self._async_send_text(text)
+    
+    def _enqueue_text(self, text: str) -> None:
+        """Queue text for the sender task (runs on the asyncio loop)"""
+        try:
+            self._outgoing_queue.put_nowait(text)
+        except asyncio.QueueFull:
+            logger.warning(f"[UI] Too many pending messages, dropping: '{text}'")
+    
     def run(self) -> None:
         """Run the main application loop"""
+        pygame = self._pygame
         logger.info("Starting PyJarvis UI")
         
         # Start asyncio event loop in separate thread
@@ -196,9 +271,7 @@ class PyJarvisApp:
         self.asyncio_thread.start()
         
         # Wait for event loop to be ready
-        while self.asyncio_loop is None:
-            import time
-            time.sleep(0.01)
+        self._loop_ready.wait()
         
         # Initialize async components
         asyncio.run_coroutine_threadsafe(self._async_initialize(), self.asyncio_loop)
@@ -208,7 +281,7 @@ class PyJarvisApp:
         
         # Main game loop
         while self.running:
-            dt = self.clock.tick(60) / 1000.0  # Delta time in seconds
+            dt = self.clock.tick(self._target_fps) / 1000.0  # Delta time in seconds
             
             # Handle events
             self._handle_events()
@@ -234,11 +307,13 @@ class PyJarvisApp:
         if self.asyncio_thread:
             self.asyncio_thread.join(timeout=1.0)
         
+        self.audio_player.close()
         pygame.quit()
         logger.info("PyJarvis UI closed")
     
     def _handle_events(self) -> None:
         """Handle Pygame events"""
+        pygame = self._pygame
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -251,10 +326,8 @@ class PyJarvisApp:
                         text = self.input_text.strip()
                         self.input_text = ""
                         if self.asyncio_loop:
-                            asyncio.run_coroutine_threadsafe(
-                                self._async_send_text(text),
-                                self.asyncio_loop
-                            )
+                            # No future needed: the sender task picks it up from the queue
+                            self.asyncio_loop.call_soon_threadsafe(self._enqueue_text, text)
                 elif event.key == pygame.K_BACKSPACE:
                     self.input_text = self.input_text[:-1]
                 else:
@@ -267,9 +340,16 @@ class PyJarvisApp:
         # Update animation controller
         audio_level = self.audio_player.get_current_level() if self.audio_player.is_playing else None
         self.animation_controller.update(dt, audio_level)
+        
+        # Drop the frame rate while nothing on screen needs smooth animation
+        if audio_level is not None or self.animation_controller.active or self.input_text:
+            self._target_fps = _ACTIVE_FPS
+        else:
+            self._target_fps = _IDLE_FPS
     
     def _render(self) -> None:
         """Render the application"""
+        pygame = self._pygame
         # Get current audio level for lip-sync effects
         audio_level = self.audio_player.get_current_level() if self.audio_player.is_playing else None
         is_speaking = audio_level is not None and audio_level > 0.05
@@ -278,50 +358,46 @@ class PyJarvisApp:
         self.face_renderer.render(self.screen, self.animation_controller, is_speaking)
         
         # Render input text with background for readability
-        font = pygame.font.Font(None, 24)
         if self.input_text:
-            text_surface = font.render(self.input_text, True, (255, 255, 255))
-            # Add semi-transparent background
-            text_bg = pygame.Surface((text_surface.get_width() + 10, text_surface.get_height() + 10))
-            text_bg.set_alpha(128)
-            text_bg.fill((0, 0, 0))
-            self.screen.blit(text_bg, (5, 5))
+            text_surface = self._render_text(self.input_text, (255, 255, 255))
+            self.screen.blit(self._text_background(text_surface), (5, 5))
             self.screen.blit(text_surface, (10, 10))
         
         # Render status with background for readability (moved to right side)
         connection_status = "Connected" if self.connected_to_service else "Disconnected"
         audio_status = "Playing" if self.audio_player.is_playing else "Idle"
         status_text = f"Service: {connection_status} | Audio: {audio_status}"
-        status_surface = font.render(status_text, True, (200, 200, 200))
-        status_bg = pygame.Surface((status_surface.get_width() + 10, status_surface.get_height() + 10))
-        status_bg.set_alpha(128)
-        status_bg.fill((0, 0, 0))
+        status_surface = self._render_text(status_text, (200, 200, 200))
         # Position status text on the right side
         status_x = self.width - status_surface.get_width() - 15
         status_y = self.height - 30
-        self.screen.blit(status_bg, (status_x - 5, status_y - 5))
+        self.screen.blit(self._text_background(status_surface), (status_x - 5, status_y - 5))
         self.screen.blit(status_surface, (status_x, status_y))
         
         # Render connection indicator in center of bottom-left circle
-        # Based on image grid: bottom-left circle center is at grid (4.5, 13.5) of (27, 18) grid
-        # Original image: 524x600, so per grid unit: x=19.41, y=33.33
-        # Original position: (87, 450) scaled to current window size
-        original_img_width = 524
-        original_img_height = 600
-        grid_x_center = 4.5  # Center of bottom-left circle horizontally
-        grid_y_center = 13.5  # Center of bottom-left circle vertically
-        original_x = (grid_x_center / 25.5) * original_img_width
-        original_y = (grid_y_center / 18.81) * original_img_height
-        # Scale to current window size
-        scale_x = self.width / original_img_width
-        scale_y = self.height / original_img_height
-        dot_x = int(original_x * scale_x)
-        dot_y = int(original_y * scale_y)
         color = (0, 255, 0) if self.connected_to_service else (255, 0, 0)
-        pygame.draw.circle(self.screen, color, (dot_x, dot_y), 8)
+        pygame.draw.circle(self.screen, color, self._dot_pos, 8)
         
         pygame.display.flip()
     
+    def _render_text(self, text: str, color: Tuple[int, int, int]) -> "pygame.Surface":
+        """Render overlay text, reusing the surface while the text and color are unchanged"""
+        if self._font is None:
+            self._font = self._pygame.font.Font(None, 24)
+        return _cached_surface(self._text_cache, (text, color), lambda: self._font.render(text, True, color))
+    
+    def _text_background(self, text_surface: "pygame.Surface") -> "pygame.Surface":
+        """Semi-transparent background padded around a text surface, one per size"""
+        pygame = self._pygame
+        size = (text_surface.get_width() + 10, text_surface.get_height() + 10)
+        
+        def create() -> pygame.Surface:
+            background = pygame.Surface(size)
+            background.set_alpha(128)
+            background.fill((0, 0, 0))
+            return background
+        
+        return _cached_surface(self._text_bg_cache, size, create)
 
 
 def main() -> None:
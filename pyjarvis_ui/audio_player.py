@@ -2,20 +2,273 @@
 Audio player for playback
 """
 
+import os
+from math import gcd
 import numpy as np
 import sounddevice as sd
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple, Union
 from loguru import logger
 import threading
 import wave
 import soundfile as sf
+import sys
+
+# Buffer for the plain synchronous header reads (the sample data itself is memory-mapped)
+_FILE_BUFFER_SIZE = 8192 if sys.platform == "win32" else 4096
+_LEVEL_WINDOW = 1024  # Most recent samples the mouth-sync RMS level is computed over
+_ROBUST_BLOCKSIZE = 8192  # Stream settings to fall back to after repeated underflows
+_ROBUST_LATENCY = 0.1
+_UNDERFLOW_LIMIT = 3  # Underflows in one playback before falling back
+_RING_SECONDS = 0.5  # Decoded audio buffered ahead of the stream callback when playing a file
+
+
+# Anti-aliasing FIR filters for polyphase resampling, per (up, down) ratio
+_FIR_CACHE: Dict[Tuple[int, int], Tuple[np.ndarray, int]] = {}
+
+
+def _polyphase_filter(up: int, down: int) -> Tuple[np.ndarray, int]:
+    """
+    Get the polyphase resampling filter for an (up, down) ratio, designed once per ratio
+    
+    Returns:
+        (filter, delay) - the gain-scaled, front-padded FIR and its delay in output samples
+    """
+    cached = _FIR_CACHE.get((up, down))
+    if cached is None:
+        from scipy import signal
+        # Same design resample_poly uses: Kaiser-windowed sinc, cutoff at the lower Nyquist,
+        # front-padded so the filter delay lands on the output sample grid
+        max_rate = max(up, down)
+        half_len = 10 * max_rate
+        fir = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0)) * up
+        pre_pad = down - half_len % down
+        fir = np.concatenate((np.zeros(pre_pad), fir)).astype(np.float32)
+        cached = _FIR_CACHE[(up, down)] = (fir, (half_len + pre_pad) // down)
+    return cached
+
+
+class _StreamResampler:
+    """Polyphase resampler for a mono stream fed block by block (same output as resample_poly on the whole signal)"""
+    
+    def __init__(self, from_rate: int, to_rate: int):
+        g = gcd(from_rate, to_rate)
+        self.up, self.down = to_rate // g, from_rate // g
+        self.half_len = 10 * max(self.up, self.down)
+        self.fir, self.delay = _polyphase_filter(self.up, self.down)
+        self._history = np.zeros(0, dtype=np.float32)  # Input still needed by upcoming outputs
+        self._history_start = 0  # Stream index of _history[0] (kept on a multiple of down)
+        self._received = 0  # Input samples seen so far
+        self._emitted = 0  # Output samples produced so far
+    
+    def _emit(self, end: int) -> np.ndarray:
+        """Filter outputs [_emitted, end) from the retained history, then drop input no longer needed"""
+        from scipy import signal
+        if end <= self._emitted:
+            return np.zeros(0, dtype=np.float32)
+        # History starting on a multiple of down keeps upfirdn's output grid aligned with the stream's
+        offset = self.delay - self._history_start * self.up // self.down
+        filtered = signal.upfirdn(self.fir, self._history, self.up, self.down)
+        block = filtered[self._emitted + offset:end + offset].astype(np.float32, copy=False)
+        self._emitted = end
+        
+        # First input sample the next output depends on
+        first = max(0, -(-(end * self.down - self.half_len) // self.up))
+        first -= first % self.down
+        self._history = self._history[first - self._history_start:]
+        self._history_start = first
+        return block
+    
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Feed a block of input and return every output sample it completes"""
+        self._history = np.concatenate((self._history, samples.astype(np.float32, copy=False)))
+        self._received += len(samples)
+        # Output j depends on input up to (j * down + half_len) // up
+        return self._emit((self._received * self.up - 1 - self.half_len) // self.down + 1)
+    
+    def flush(self) -> np.ndarray:
+        """Return the remaining output, treating input past the end as silence"""
+        return self._emit(-(-self._received * self.up // self.down))
+
+
+# WAV sample width -> (sample dtype, scale, bias) mapping integer PCM to float32 [-1.0, 1.0)
+_PCM_FORMATS = {
+    1: (np.dtype(np.uint8), 1.0 / 128.0, 128.0),  # 8-bit WAV is unsigned
+    2: (np.dtype('<i2'), 1.0 / 32768.0, 0.0),
+    4: (np.dtype('<i4'), 1.0 / 2147483648.0, 0.0),
+}
+
+
+def _to_f32(src: np.ndarray, dst: np.ndarray, scale: float, bias: float = 0.0) -> np.ndarray:
+    """Convert integer PCM to float32 as (src - bias) * scale, cast fused into the first pass, written into dst"""
+    if bias:
+        np.subtract(src, bias, out=dst, dtype=np.float32, casting='unsafe')
+        return np.multiply(dst, scale, out=dst)
+    return np.multiply(src, scale, out=dst, dtype=np.float32, casting='unsafe')
+
+
+class _FileDecoder:
+    """Decodes an audio file block by block to mono float32 at the playback sample rate"""
+    
+    def __init__(self, audio_path: Path, sample_rate: int, blocksize: int):
+        """
+        Open an audio file for block decoding (only the header is read here)
+        
+        Args:
+            audio_path: Path to audio file
+            sample_rate: Playback sample rate in Hz
+            blocksize: Source frames decoded per block
+        """
+        self.blocksize = blocksize
+        self._frames: Optional[np.ndarray] = None
+        self._sound_file: Optional[sf.SoundFile] = None
+        
+        if audio_path.suffix.lower() == '.wav':
+            # Use wave for WAV files (no external dependencies) to parse the header only
+            with open(audio_path, 'rb', buffering=_FILE_BUFFER_SIZE) as audio_file, wave.open(audio_file, 'rb') as wav_file:
+                source_rate = wav_file.getframerate()
+                self.channels = wav_file.getnchannels()
+                self.sample_width = wav_file.getsampwidth()
+                n_frames = wav_file.getnframes()
+                data_offset = audio_file.tell()  # wave stops at the start of the data chunk
+                file_size = os.fstat(audio_file.fileno()).st_size
+            
+            # The sample data is paged in from a read-only memory map, one (frames, channels) block at a time
+            dtype, self._scale, self._bias = _PCM_FORMATS.get(self.sample_width, _PCM_FORMATS[1])
+            self.n_frames = min(n_frames, (file_size - data_offset) // (dtype.itemsize * self.channels))
+            if self.n_frames > 0:
+                self._frames = np.memmap(audio_path, dtype=dtype, mode='r', offset=data_offset,
+                                         shape=(self.n_frames, self.channels))
+            else:
+                self._frames = np.zeros((0, self.channels), dtype=dtype)
+        else:
+            # soundfile for everything else (MP3 requires libsndfile with MP3 support)
+            self._sound_file = sf.SoundFile(str(audio_path))
+            source_rate = self._sound_file.samplerate
+            self.channels = self._sound_file.channels
+            self.n_frames = self._sound_file.frames
+        
+        self.duration_seconds = self.n_frames / source_rate if source_rate else 0.0
+        # Reused for every block (a block is copied into the playback ring before the next is decoded)
+        self._samples = np.empty((blocksize, self.channels), dtype=np.float32)
+        self._mono = np.empty(blocksize, dtype=np.float32) if self.channels > 1 else None
+        self._resampler = _StreamResampler(source_rate, sample_rate) if source_rate != sample_rate else None
+    
+    def _source_blocks(self) -> Iterator[np.ndarray]:
+        """Yield (frames, channels) float32 [-1.0, 1.0] blocks of the file, all decoded into the same buffer"""
+        if self._sound_file is not None:
+            # soundfile decodes straight into the buffer (no array allocated per block)
+            yield from self._sound_file.blocks(dtype='float32', always_2d=True, out=self._samples)
+            return
+        for start in range(0, self.n_frames, self.blocksize):
+            frames = self._frames[start:start + self.blocksize]
+            yield _to_f32(frames, self._samples[:len(frames)], self._scale, self._bias)
+    
+    def _to_mono(self, block: np.ndarray) -> np.ndarray:
+        """Mix a (frames, channels) block down to mono"""
+        if self.channels == 1:
+            return block[:, 0]
+        
+        # Convert stereo to mono: sum the channels into the mono buffer, then scale once
+        mono = self._mono[:len(block)]
+        np.add(block[:, 0], block[:, 1], out=mono)
+        for channel in range(2, self.channels):
+            np.add(mono, block[:, channel], out=mono)
+        mono *= 1.0 / self.channels
+        return mono
+    
+    def blocks(self) -> Iterator[np.ndarray]:
+        """Yield the decoded (and resampled) audio block by block"""
+        for block in self._source_blocks():
+            if len(block) == 0:
+                break
+            block = self._to_mono(block)
+            if self._resampler is not None:
+                block = self._resampler.process(block)
+            if len(block):
+                yield block
+        if self._resampler is not None:
+            tail = self._resampler.flush()
+            if len(tail):
+                yield tail
+    
+    def close(self) -> None:
+        """Release the file (the memory map is unmapped once the array is dropped)"""
+        self._frames = None
+        if self._sound_file is not None:
+            self._sound_file.close()
+            self._sound_file = None
+
+
+class _SampleRing:
+    """
+    Single-producer, single-consumer ring of mono float32 samples
+    
+    The file thread decodes into it and the stream callback copies out of it, so
+    disk I/O and resampling never run on the real-time audio thread. Each side only
+    advances its own counter, and samples are copied before the counter moves.
+    """
+    
+    def __init__(self, capacity: int):
+        self._buffer = np.zeros(capacity, dtype=np.float32)
+        self._capacity = capacity
+        self._written = 0  # Samples written so far (advanced by the producer only)
+        self._read = 0  # Samples read so far (advanced by the consumer only)
+        self._space = threading.Event()  # Set by the consumer whenever it frees space
+        self._cancelled = False
+        self.closed = False  # Set by the producer after the last write
+    
+    @property
+    def exhausted(self) -> bool:
+        """Whether every sample has been written and read"""
+        return self.closed and self._read == self._written
+    
+    def write(self, samples: np.ndarray) -> bool:
+        """Copy samples in, waiting for space as needed (False once the ring is cancelled)"""
+        pos = 0
+        while pos < len(samples) and not self._cancelled:
+            free = self._capacity - (self._written - self._read)
+            if free == 0:
+                self._space.clear()
+                if self._capacity == self._written - self._read and not self._cancelled:
+                    self._space.wait(timeout=0.5)
+                continue
+            n = min(free, len(samples) - pos)
+            start = self._written % self._capacity
+            first = min(n, self._capacity - start)
+            self._buffer[start:start + first] = samples[pos:pos + first]
+            self._buffer[:n - first] = samples[pos + first:pos + n]
+            self._written += n
+            pos += n
+        return not self._cancelled
+    
+    def read(self, out: np.ndarray) -> int:
+        """Copy up to len(out) buffered samples into out without waiting, returning how many"""
+        n = min(len(out), self._written - self._read)
+        start = self._read % self._capacity
+        first = min(n, self._capacity - start)
+        out[:first] = self._buffer[start:start + first]
+        out[first:n] = self._buffer[:n - first]
+        self._read += n
+        if n:
+            self._space.set()
+        return n
+    
+    def close(self) -> None:
+        """Mark the end of the samples"""
+        self.closed = True
+    
+    def cancel(self) -> None:
+        """Abandon the ring, waking a producer waiting for space"""
+        self._cancelled = True
+        self._space.set()
 
 
 class AudioPlayer:
     """Audio player for playback"""
     
-    def __init__(self, sample_rate: int = 44100, channels: int = 1, delete_after_playback: bool = True):
+    def __init__(self, sample_rate: int = 44100, channels: int = 1, delete_after_playback: bool = True,
+                 blocksize: int = 1024, latency: Union[float, str] = 'low'):
         """
         Create a new audio player
         
@@ -23,111 +276,137 @@ class AudioPlayer:
             sample_rate: Sample rate in Hz
             channels: Number of audio channels
             delete_after_playback: Whether to delete audio files after playback
+            blocksize: Frames per stream callback (a power of two matching the device period works best)
+            latency: Output latency in seconds, or 'low'/'high' for the device's default
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.delete_after_playback = delete_after_playback
+        self.blocksize = blocksize
+        self.latency = latency
+        self._underflows = 0  # Output underflows in the current playback
+        self._robust = False  # Set after repeated underflows: use large buffers from then on
+        self._stream_robust = False  # Buffering the open stream was created with
         self.is_playing = False
-        self.current_stream: Optional[sd.OutputStream] = None
-        self.current_samples: Optional[np.ndarray] = None
+        self._done = threading.Event()  # Set whenever nothing is playing
+        self._done.set()
+        self.current_stream: Optional[sd.OutputStream] = None  # Opened on first playback, then kept open
+        self._stream_idle = False  # Set by the callback when it stopped the stream after a playback ended
+        self._stream_lock = threading.Lock()  # Serialises opening/closing the stream
+        self._lock = threading.Lock()  # Guards the playback state shared with the stream callback
+        self._generation = 0  # Bumped by stop(), so a stale file thread can't end a newer playback
+        self.current_samples: Optional[np.ndarray] = None  # 2D int16 frames from play()
         self.sample_index = 0
+        self._ring: Optional[_SampleRing] = None  # Decoded samples when streaming a file
         self.current_audio_file: Optional[Path] = None
         self._playback_thread: Optional[threading.Thread] = None
+        
+        # Sliding RMS window over the played samples, maintained by the stream callback
+        self._level_ring = np.zeros(_LEVEL_WINDOW, dtype=np.float32)
+        self._level_pos = 0
+        self._level_count = 0
+        self._level_sum = 0.0  # Running sum of squares of the samples in the ring
         logger.debug(f"Audio player created (sample_rate: {sample_rate}, channels: {channels}, delete_after_playback: {delete_after_playback})")
     
-    def _stream_callback(self, outdata, frames, time, status):
-        """Callback function for audio stream"""
-        # Only log status if it's an error, not warnings (underflows can be minor)
-        if status:
-            # Underflow is expected occasionally, only log if it's frequent or other errors
-            if status.output_underflow:
-                # Silently handle occasional underflows - they're usually not critical
-                pass
-            else:
-                logger.warning(f"[Audio] Stream status: {status}")
-        
-        if self.current_samples is None or self.sample_index >= len(self.current_samples):
-            # No more data, output silence and stop
-            outdata.fill(0)
-            if self.is_playing:
-                logger.debug("[Audio] Audio playback completed")
-                self.is_playing = False
-                if self.current_stream:
-                    try:
-                        self.current_stream.stop()
-                    except:
-                        pass
-                    self.current_stream = None
+    def _reset_level(self) -> None:
+        """Empty the RMS window (new playback)"""
+        self._level_ring.fill(0.0)
+        self._level_pos = 0
+        self._level_count = 0
+        self._level_sum = 0.0
+    
+    def _update_level(self, played: np.ndarray) -> None:
+        """Slide the RMS window over samples just played, updating the running sum of squares"""
+        n = min(len(played), _LEVEL_WINDOW)
+        if n == 0:
             return
-        
-        # Calculate how many samples to copy
-        remaining = len(self.current_samples) - self.sample_index
-        frames_to_copy = min(frames, remaining)
-        
-        # Copy samples to output buffer
-        if self.channels == 1:
-            # Ensure we copy the right shape (1D array for mono)
-            samples_slice = self.current_samples[
-                self.sample_index:self.sample_index + frames_to_copy
-            ]
-            # Ensure samples_slice is 1D for proper assignment
-            if samples_slice.ndim == 0:
-                samples_slice = np.array([samples_slice])
-            outdata[:frames_to_copy, 0] = samples_slice.reshape(-1)
-            # Fill rest with zeros if needed
-            if frames_to_copy < frames:
-                outdata[frames_to_copy:, 0] = 0.0
+        played = played[-n:]
+        ring = self._level_ring
+        pos = self._level_pos
+        first = min(n, _LEVEL_WINDOW - pos)  # Samples before the ring wraps around
+        old_head, old_tail = ring[pos:pos + first], ring[:n - first]
+        self._level_sum += float(np.dot(played, played)) - float(np.dot(old_head, old_head)) - float(np.dot(old_tail, old_tail))
+        old_head[:] = played[:first]
+        old_tail[:] = played[first:]
+        self._level_pos = (pos + n) % _LEVEL_WINDOW
+        self._level_count = min(self._level_count + n, _LEVEL_WINDOW)
+    
+    def _check_status(self, status) -> None:
+        """Handle the stream status passed to a callback"""
+        # Only log status if it's an error, not warnings (underflows can be minor)
+        if status.output_underflow:
+            # Occasional underflows aren't critical; repeated ones switch to robust buffering
+            self._underflows += 1
+            if self._underflows == _UNDERFLOW_LIMIT and not self._robust:
+                self._robust = True
+                logger.warning("[Audio] Repeated output underflows, using larger buffers from the next playback")
         else:
-            # Multi-channel
-            samples_slice = self.current_samples[
-                self.sample_index:self.sample_index + frames_to_copy
-            ]
-            if len(samples_slice.shape) == 1:
-                # Reshape if needed
-                samples_slice = samples_slice.reshape(-1, self.channels)
-            outdata[:frames_to_copy] = samples_slice
-            if frames_to_copy < frames:
-                outdata[frames_to_copy:] = 0
-        
-        self.sample_index += frames_to_copy
+            logger.warning(f"[Audio] Stream status: {status}")
     
-    def play(self, audio_data: bytes) -> None:
-        """
-        Play PCM audio data
+    def _finish_playback(self) -> None:
+        """No more data: mark playback completed (the callback then stops the stream)"""
+        logger.debug("[Audio] Audio playback completed")
+        self.is_playing = False
+        self._done.set()
+        self._ring = None
+        self.current_samples = None
+    
+    def _stream_callback(self, outdata, frames, time, status):
+        """Callback function for the shared audio stream (only copies samples, never decodes)"""
+        if status:
+            self._check_status(status)
         
-        Args:
-            audio_data: PCM audio data (int16 bytes)
-        """
-        try:
-            # Stop any currently playing audio
-            self.stop()
+        with self._lock:
+            if not self.is_playing:
+                # Nothing to play: let the stream go idle until the next play() restarts it
+                outdata.fill(0)
+                self._stream_idle = True
+                raise sd.CallbackStop
             
-            # Convert bytes to numpy array (int16)
-            # Ensure proper byte order (little-endian for Windows)
-            # Using copy() instead of view to avoid issues with mutable buffers
-            samples = np.frombuffer(audio_data, dtype='<i2').copy()  # '<i2' = little-endian int16
-            
-            # Convert to float32 [-1.0, 1.0]
-            # Divide by 32768.0 to convert from int16 range [-32768, 32767] to [-1.0, 1.0]
-            samples_float = samples.astype(np.float32) / 32768.0
-            
-            # Reshape if needed
-            if self.channels > 1:
-                samples_float = samples_float.reshape(-1, self.channels)
+            ring = self._ring
+            samples = self.current_samples
+            if samples is not None:
+                # PCM from play(): converted straight into the output buffer
+                filled = min(frames, len(samples) - self.sample_index)
+                _to_f32(samples[self.sample_index:self.sample_index + filled], outdata[:filled], 1.0 / 32768.0)
+                self.sample_index += filled
+            elif ring is not None:
+                # Decoded file audio is mono: copy it into the first channel, then to the others
+                filled = ring.read(outdata[:, 0])
+                if self.channels > 1:
+                    outdata[:filled, 1:] = outdata[:filled, :1]
+            else:
+                filled = 0
             
-            # Store samples for streaming
-            self.current_samples = samples_float
-            self.sample_index = 0
-            self.is_playing = True
+            # Fill rest with zeros if needed (a ring that is still being filled just plays silence)
+            outdata[filled:] = 0
+            self._update_level(outdata[:filled, 0])
             
-            # Create output stream with callback
-            # Use larger blocksize and higher latency to prevent underflows
-            # blocksize: larger = less frequent callbacks but smoother playback
-            # latency: 'high' means higher latency priority (more stable)
-            blocksize = 8192  # Increased from 4096 for better stability
-            latency = 0.1  # 100ms latency for smoother playback
+            if filled == 0 and (ring is None or ring.exhausted):
+                self._finish_playback()
+                self._stream_idle = True
+                raise sd.CallbackStop
+    
+    def _ensure_stream(self) -> None:
+        """Open and start the shared output stream, reopening it if the buffering has to change"""
+        with self._stream_lock:
+            with self._lock:
+                idle, self._stream_idle = self._stream_idle, False
+            if self.current_stream is not None:
+                if self._stream_robust == self._robust:
+                    if idle:
+                        # The callback stopped the stream when the last playback ended
+                        self.current_stream.stop()
+                        self.current_stream.start()
+                    return
+                self._close_stream()
             
-            self.current_stream = sd.OutputStream(
+            if self._robust:
+                blocksize, latency = _ROBUST_BLOCKSIZE, _ROBUST_LATENCY
+            else:
+                # 'low' lets PortAudio use the device's default low output latency
+                blocksize, latency = self.blocksize, self.latency
+            stream = sd.OutputStream(
                 samplerate=self.sample_rate,
                 channels=self.channels,
                 dtype=np.float32,
@@ -135,42 +414,87 @@ class AudioPlayer:
                 latency=latency,
                 callback=self._stream_callback
             )
+            stream.start()
+            self.current_stream = stream
+            self._stream_robust = self._robust
+    
+    def _close_stream(self) -> None:
+        """Stop and close the shared output stream"""
+        try:
+            self.current_stream.close()
+        except:
+            pass
+        self.current_stream = None
+    
+    def _start_playback(self, samples: Optional[np.ndarray], ring: Optional[_SampleRing], generation: int) -> bool:
+        """Hand new samples to the stream, unless stop() was called since generation was taken"""
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self.current_samples = samples
+            self.sample_index = 0
+            self._ring = ring
+            self._underflows = 0
+            self._reset_level()
+            self._done.clear()
+            self.is_playing = True
+        return True
+    
+    def play(self, audio_data: bytes) -> None:
+        """
+        Play PCM audio data
+        
+        Args:
+            audio_data: PCM audio data (int16 bytes)
+        """
+        try:
+            # Stop any currently playing audio
+            generation = self.stop()
             
-            # Start the stream
-            self.current_stream.start()
+            # Store PCM (whole frames, no copy); the stream callback converts it as it plays
+            frame_bytes = 2 * self.channels
+            samples = np.frombuffer(audio_data, dtype='<i2', count=len(audio_data) // frame_bytes * self.channels)
+            if sys.byteorder != 'little':
+                samples = samples.astype(np.int16)
+            if self._start_playback(samples.reshape(-1, self.channels), None, generation):
+                self._ensure_stream()
             
             logger.info(f"[Audio] Playing {len(samples)} samples at {self.sample_rate}Hz, {self.channels} channels")
             
         except Exception as e:
             logger.error(f"[Audio] Failed to play audio: {e}")
-            self.is_playing = False
-            if self.current_stream:
-                try:
-                    self.current_stream.stop()
-                except:
-                    pass
-                self.current_stream = None
+            self.stop()
             raise
     
-    def stop(self) -> None:
-        """Stop audio playback"""
-        if self.current_stream:
-            try:
-                self.current_stream.stop()
-            except:
-                pass
-            self.current_stream = None
+    def stop(self) -> int:
+        """
+        Stop audio playback (the output stream itself stays open for the next playback)
         
-        self.is_playing = False
-        self.current_samples = None
-        self.sample_index = 0
+        Returns:
+            The new playback generation, for starting the next playback
+        """
+        with self._lock:
+            self._generation += 1
+            self.is_playing = False
+            self._done.set()
+            ring, self._ring = self._ring, None
+            self.current_samples = None
+            self.sample_index = 0
+        if ring is not None:
+            ring.cancel()
         logger.debug("[Audio] Playback stopped")
+        return self._generation
+    
+    def close(self) -> None:
+        """Stop playback and release the output stream"""
+        self.stop()
+        with self._stream_lock:
+            if self.current_stream is not None:
+                self._close_stream()
     
     def wait_for_completion(self) -> None:
         """Wait for audio playback to complete"""
-        if self.current_stream:
-            while self.is_playing:
-                sd.sleep(10)  # Sleep 10ms at a time
+        self._done.wait()
     
     def get_current_level(self) -> float:
         """
@@ -179,20 +503,14 @@ class AudioPlayer:
         Returns:
             Audio level (0.0 to 1.0)
         """
-        if not self.is_playing or self.current_samples is None:
+        if not self.is_playing:
             return 0.0
+        if self._level_count == 0:
+            return 0.5
         
-        # Calculate RMS of recent samples for mouth sync
-        if self.sample_index < len(self.current_samples):
-            # Get a window of recent samples
-            window_start = max(0, self.sample_index - 1024)
-            window_end = min(len(self.current_samples), self.sample_index)
-            if window_end > window_start:
-                recent_samples = self.current_samples[window_start:window_end]
-                rms = np.sqrt(np.mean(recent_samples ** 2))
-                return min(1.0, rms * 2.0)  # Scale to 0-1 range
-        
-        return 0.5 if self.is_playing else 0.0
+        # RMS of the most recently played samples (kept up to date by the stream callback)
+        rms = (max(self._level_sum, 0.0) / self._level_count) ** 0.5
+        return min(1.0, rms * 2.0)  # Scale to 0-1 range
     
     def play_file(self, audio_file_path: str) -> None:
         """
@@ -209,141 +527,74 @@ class AudioPlayer:
         logger.info(f"[Audio] Playing audio file: {audio_path}")
         
         # Stop any currently playing audio
-        self.stop()
+        generation = self.stop()
         
         # Store file path for deletion after playback
         self.current_audio_file = audio_path
         
+        # Mark as playing from now on, so waiters don't return before the thread starts
+        self._done.clear()
+        
         # Play audio file in a separate thread
         self._playback_thread = threading.Thread(
             target=self._play_file_thread,
-            args=(audio_path,),
+            args=(audio_path, generation),
             daemon=True
         )
         self._playback_thread.start()
     
-    def _play_file_thread(self, audio_path: Path) -> None:
+    def _play_file_thread(self, audio_path: Path, generation: int) -> None:
         """Play audio file in a separate thread"""
+        decoder: Optional[_FileDecoder] = None
         try:
-            self.is_playing = True
-            
-            # Load audio file based on extension
+            # Open the file; this thread decodes it block by block into a ring the stream callback plays from
+            blocksize = _ROBUST_BLOCKSIZE if self._robust else self.blocksize
             audio_ext = audio_path.suffix.lower()
-            
-            if audio_ext == '.wav':
-                # Use wave for WAV files (no external dependencies)
-                with wave.open(str(audio_path), 'rb') as wav_file:
-                    sample_rate = wav_file.getframerate()
-                    channels = wav_file.getnchannels()
-                    sample_width = wav_file.getsampwidth()
-                    frames = wav_file.readframes(-1)
-                    
-                    # Convert bytes to numpy array
-                    if sample_width == 2:  # 16-bit
-                        samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
-                    elif sample_width == 4:  # 32-bit
-                        samples = np.frombuffer(frames, dtype=np.int32).astype(np.float32) / 2147483648.0
-                    else:  # 8-bit
-                        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
-                    
-                    # Convert stereo to mono if needed
-                    if channels > 1:
-                        samples = samples.reshape(-1, channels).mean(axis=1)
-                    
-                    # Resample if needed
-                    if sample_rate != self.sample_rate:
-                        from scipy import signal
-                        num_samples = int(len(samples) * (self.sample_rate / sample_rate))
-                        samples = signal.resample(samples, num_samples).astype(np.float32)
-                        
-            elif audio_ext == '.mp3':
-                # Try to use soundfile first (requires ffmpeg for MP3)
-                try:
-                    samples, sample_rate = sf.read(str(audio_path))
-                    # Convert to mono if stereo
-                    if samples.ndim > 1:
-                        samples = samples.mean(axis=1)
-                    
-                    # Resample if needed
-                    if sample_rate != self.sample_rate:
-                        from scipy import signal
-                        num_samples = int(len(samples) * (self.sample_rate / sample_rate))
-                        samples = signal.resample(samples, num_samples).astype(np.float32)
-                except Exception as e:
+            try:
+                decoder = _FileDecoder(audio_path, self.sample_rate, blocksize)
+            except Exception as e:
+                if audio_ext == '.mp3':
                     logger.error(f"[Audio] Failed to load MP3 file (ffmpeg may not be installed): {e}")
                     logger.error("[Audio] Please install ffmpeg or use WAV format")
                     raise RuntimeError("MP3 playback requires ffmpeg. Install ffmpeg or use WAV format.")
-            else:
-                # Try soundfile as fallback
-                try:
-                    samples, sample_rate = sf.read(str(audio_path))
-                    if samples.ndim > 1:
-                        samples = samples.mean(axis=1)
-                    if sample_rate != self.sample_rate:
-                        from scipy import signal
-                        num_samples = int(len(samples) * (self.sample_rate / sample_rate))
-                        samples = signal.resample(samples, num_samples).astype(np.float32)
-                except Exception as e:
-                    logger.error(f"[Audio] Failed to load audio file {audio_ext}: {e}")
-                    raise
-            
-            # Store samples for streaming
-            self.current_samples = samples
-            self.sample_index = 0
+                logger.error(f"[Audio] Failed to load audio file {audio_ext}: {e}")
+                raise
             
-            # Create output stream
-            blocksize = 8192
-            latency = 0.1
-            
-            self.current_stream = sd.OutputStream(
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype=np.float32,
-                blocksize=blocksize,
-                latency=latency,
-                callback=self._stream_callback
-            )
-            
-            # Start the stream
-            self.current_stream.start()
-            
-            logger.info(f"[Audio] Playing {len(samples)} samples at {self.sample_rate}Hz")
-            
-            # Wait for playback to complete
-            # Calculate approximate duration
-            duration_seconds = len(samples) / self.sample_rate
-            import time
-            start_time = time.time()
-            
-            while self.is_playing and self.sample_index < len(samples):
-                elapsed = time.time() - start_time
-                if elapsed > duration_seconds + 1.0:  # Add 1 second buffer
-                    break
-                time.sleep(0.1)
-            
-            logger.info("[Audio] Playback completed")
+            ring = _SampleRing(max(int(_RING_SECONDS * self.sample_rate), 4 * blocksize))
+            if self._start_playback(None, ring, generation):
+                self._ensure_stream()
+                logger.info(f"[Audio] Streaming {decoder.duration_seconds:.2f}s of audio at {self.sample_rate}Hz")
+                
+                for block in decoder.blocks():
+                    if not ring.write(block):
+                        break  # Stopped, or replaced by a newer playback
+                ring.close()
+                
+                # Wait for playback to complete (the stream callback or stop() sets _done)
+                self._done.wait(timeout=decoder.duration_seconds + 1.0)  # Add 1 second buffer
+                
+                logger.info("[Audio] Playback completed")
             
         except Exception as e:
             logger.error(f"[Audio] Failed to play audio file: {e}")
             import traceback
             logger.debug(traceback.format_exc())
         finally:
-            self.is_playing = False
-            if self.current_stream:
-                try:
-                    self.current_stream.stop()
-                except:
-                    pass
-                self.current_stream = None
-            self.current_samples = None
+            # Only end the playback if it's still ours (play()/play_file() may have started another)
+            with self._lock:
+                if generation == self._generation:
+                    self.is_playing = False
+                    self._done.set()
+                    self._ring = None
+                    self.current_samples = None
+                    self.current_audio_file = None
+            if decoder is not None:
+                decoder.close()
             
             # Delete file after playback if configured
-            if self.delete_after_playback and self.current_audio_file and self.current_audio_file.exists():
+            if self.delete_after_playback and audio_path.exists():
                 try:
-                    self.current_audio_file.unlink()
-                    logger.debug(f"[Audio] Deleted audio file: {self.current_audio_file}")
+                    audio_path.unlink()
+                    logger.debug(f"[Audio] Deleted audio file: {audio_path}")
                 except Exception as e:
                     logger.warning(f"[Audio] Failed to delete audio file: {e}")
-            
-            self.current_audio_file = None
-
@@ -4,14 +4,33 @@ Face renderer for drawing animated digital face
 
 import pygame
 import os
-import time
 import math
-from typing import Optional
+import numpy as np
+from functools import partial
+from typing import NamedTuple, Optional, Tuple
 from pyjarvis_core import AnimationController, AnimationState
 
+
+class _Layout(NamedTuple):
+    """Screen-space positions and sizes, fixed for the lifetime of a renderer"""
+    eye: Tuple[int, int]
+    eye_glow_radius: int
+    animation_center: Tuple[int, int]
+    ring_scale: float  # Scale from reference ring radii/widths to screen pixels
+
+
 class FaceRenderer:
     """Renders the digital face with eyes and mouth"""
     
+    __slots__ = (
+        'width', 'height', 'center_x', 'center_y',
+        'background_image', 'original_img_width', 'original_img_height',
+        'scale_x', 'scale_y', 'eye_x', 'eye_y', 'eye_glow_radius',
+        'animation_center_x', 'animation_center_y', 'layout',
+        '_eye_glow_cached', '_eye_glow_scratch', '_eye_glow_pos', '_anim_surface', '_glow_cache',
+        '_scaled_rings', '_anim_extent', '_anim_pos', '_ring_draws',
+    )
+    
     # Original image dimensions (reference coordinates)
     ORIGINAL_IMAGE_WIDTH = 524
     ORIGINAL_IMAGE_HEIGHT = 800
@@ -22,6 +41,32 @@ class FaceRenderer:
     ORIGINAL_EYE_WIDTH = 125
     ORIGINAL_EYE_HEIGHT = 116
     
+    # Eye glow layers: (radius multiplier, alpha multiplier), drawn inside out
+    EYE_GLOW_LAYERS = ((1.0, 1.0), (1.5, 0.7), (2.0, 0.4))
+    
+    # Base glow color (cyan/blue to match the UI theme)
+    GLOW_COLOR = (0, 200, 255)
+    
+    # Concentric rings of the multi-circle animation, in reference pixels
+    RINGS = (
+        # (radius, width, style, glow_intensity_multiplier)
+        # Inner rings - solid, brighter
+        (15, 2, 'solid', 1.0),
+        (25, 2, 'solid', 0.8),
+        # Middle rings - dashed
+        (35, 2, 'dashed', 0.7),
+        (45, 2, 'dashed', 0.6),
+        # Outer rings - dotted
+        (55, 1, 'dotted', 0.5),
+        (65, 1, 'dotted', 0.4),
+        (75, 1, 'dotted', 0.3),
+    )
+    DASHED_RING_SEGMENTS = 8
+    DOTTED_RING_DOTS = 16
+    
+    # Breathing pulse phase rate in radians per second (pulse speed 2.0 * pi)
+    PULSE_RATE = 2.0 * math.pi
+    
     def __init__(self, width: int = 800, height: int = 524, robot_image_path: Optional[str] = None):
         """
         Create a new face renderer
@@ -62,7 +107,7 @@ class FaceRenderer:
         # Eye glow radius based on actual eye dimensions (use average of width/height)
         eye_avg_size = (self.ORIGINAL_EYE_WIDTH + self.ORIGINAL_EYE_HEIGHT) / 2
         self.eye_glow_radius = int(eye_avg_size * max(self.scale_x, self.scale_y) * 0.6)
-
+        
         # Multi-circle animation position (mid-left circular element)
         # Based on image grid: mid-left circle center is at grid (4.5, 5) of (27, 18) grid
         grid_x_center = 4.5  # Center of mid-left circle horizontally
@@ -72,8 +117,77 @@ class FaceRenderer:
         self.animation_center_x = int(original_x * self.scale_x)
         self.animation_center_y = int(original_y * self.scale_y)
         
-        # Animation timing
-        self.animation_start_time = time.time()
+        # Everything the draw methods position with, packed once
+        self.layout = _Layout(
+            eye=(self.eye_x, self.eye_y),
+            eye_glow_radius=self.eye_glow_radius,
+            animation_center=(self.animation_center_x, self.animation_center_y),
+            ring_scale=max(self.scale_x, self.scale_y),
+        )
+        
+        # Eye glow pre-rendered once at full intensity; each frame only scales its brightness
+        self._eye_glow_cached = self._render_eye_glow(1.0)
+        self._eye_glow_scratch = pygame.Surface(self._eye_glow_cached.get_size())
+        eye_x, eye_y = self.layout.eye
+        self._eye_glow_pos = (eye_x - self._eye_glow_cached.get_width() // 2,
+                              eye_y - self._eye_glow_cached.get_height() // 2)
+        
+        # Ring table scaled to screen pixels once: (radius, width, style, intensity multiplier, glow radius)
+        ring_scale = self.layout.ring_scale
+        self._scaled_rings = []
+        for ring_radius, ring_width, style, intensity_mult in self.RINGS:
+            scaled_radius = int(ring_radius * ring_scale)
+            scaled_width = max(1, int(ring_width * ring_scale))
+            glow_radius = scaled_radius + scaled_width * 2
+            self._scaled_rings.append((scaled_radius, scaled_width, style, intensity_mult, glow_radius))
+        
+        # Outer glow disc of every ring pre-rendered once per radius; each frame only sets its alpha
+        self._glow_cache = {ring[4]: self._render_glow_disc(ring[4]) for ring in self._scaled_rings}
+        
+        # The rings are composited in a surface just big enough for them (their glows reach furthest),
+        # centered on the animation; only that square is blended onto the screen
+        self._anim_extent = max(max(glow_radius, radius + width) for radius, width, _, _, glow_radius in self._scaled_rings) + 1
+        animation_x, animation_y = self.layout.animation_center
+        self._anim_pos = (animation_x - self._anim_extent, animation_y - self._anim_extent)
+        
+        # Dash and dot positions of the patterned rings, computed once on screen around the animation
+        # center, then moved into the compositing surface
+        offset_x, offset_y = self._anim_pos
+        ring_points = {}
+        for scaled_radius, _, style, _, _ in self._scaled_rings:
+            if style == 'dashed':
+                dashes = self._dash_points(animation_x, animation_y, scaled_radius, self.DASHED_RING_SEGMENTS)
+                ring_points[scaled_radius] = tuple(
+                    tuple((px - offset_x, py - offset_y) for px, py in dash) for dash in dashes)
+            elif style == 'dotted':
+                dots = self._dot_points(animation_x, animation_y, scaled_radius, self.DOTTED_RING_DOTS)
+                ring_points[scaled_radius] = tuple((px - offset_x, py - offset_y) for px, py in dots)
+        
+        # Per-frame compositing surface for the ring animation, cleared instead of reallocated
+        self._anim_surface = pygame.Surface((self._anim_extent * 2, self._anim_extent * 2), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            # Match the display's pixel format so blits take SDL's fast path
+            if self.background_image:
+                self.background_image = self.background_image.convert()  # Opaque: a plain copy per frame
+            self._anim_surface = self._anim_surface.convert_alpha()
+            self._eye_glow_cached = self._eye_glow_cached.convert()
+            self._eye_glow_scratch = self._eye_glow_scratch.convert()
+            self._glow_cache = {radius: disc.convert() for radius, disc in self._glow_cache.items()}
+        
+        # Each ring's draw calls resolved once, with everything but the color/alpha bound:
+        # (draw ring(color), draw outer glow(alpha), glow intensity multiplier)
+        center = self._anim_extent  # Animation center within the compositing surface
+        anim_surface = self._anim_surface
+        self._ring_draws = []
+        for scaled_radius, scaled_width, style, intensity_mult, glow_radius in self._scaled_rings:
+            if style == 'solid':
+                draw = partial(self._draw_ring, anim_surface, center, center, scaled_radius, scaled_width)
+            elif style == 'dashed':
+                draw = partial(self._draw_dashed_ring, anim_surface, ring_points[scaled_radius], scaled_width)
+            else:
+                draw = partial(self._draw_dotted_ring, anim_surface, ring_points[scaled_radius], scaled_width)
+            draw_glow = partial(self._draw_glow_circle, anim_surface, center, center, glow_radius)
+            self._ring_draws.append((draw, draw_glow, intensity_mult))
     
     def render(self, surface: pygame.Surface, animation_controller: AnimationController, is_speaking: bool = False) -> None:
         """
@@ -101,161 +215,155 @@ class FaceRenderer:
             # Draw eye glow effect
             self._draw_eye_glow(surface, state)
     
+    def _render_eye_glow(self, glow_intensity: float) -> pygame.Surface:
+        """Render the eye glow at the given intensity as a radial texture for additive blits"""
+        eye_glow_radius = self.layout.eye_glow_radius
+        outer_radius = int(eye_glow_radius * self.EYE_GLOW_LAYERS[-1][0])
+        
+        # Distance of every texel from the glow center
+        ys, xs = np.ogrid[-outer_radius:outer_radius, -outer_radius:outer_radius]
+        distance = np.hypot(xs, ys)
+        
+        # Alpha-composite the layers (drawn inside out) over each texel: coverage = 1 - product of (1 - alpha)
+        alpha = int(180 * glow_intensity)
+        transparency = np.ones(distance.shape)
+        for radius_mult, alpha_mult in self.EYE_GLOW_LAYERS:
+            transparency[distance <= int(eye_glow_radius * radius_mult)] *= 1.0 - int(alpha * alpha_mult) / 255.0
+        coverage = 1.0 - transparency
+        
+        # Cyan/teal glow color (0, 200, 255) similar to the robot's eyes in the image
+        texture = np.zeros(distance.shape + (3,), dtype=np.uint8)
+        texture[..., 1] = int(200 * glow_intensity) * coverage
+        texture[..., 2] = int(255 * glow_intensity) * coverage
+        return pygame.surfarray.make_surface(texture.transpose(1, 0, 2))  # surfarray is indexed (x, y)
+    
+    @classmethod
+    def _eye_glow_brightness(cls, glow_intensity: float) -> float:
+        """Brightness of the glow core at an intensity, relative to full intensity"""
+        def coverage(intensity: float) -> float:
+            # Alpha of the stacked layers over the core
+            alpha = int(180 * intensity)
+            transparency = 1.0
+            for _, alpha_mult in cls.EYE_GLOW_LAYERS:
+                transparency *= 1.0 - int(alpha * alpha_mult) / 255.0
+            return 1.0 - transparency
+        return glow_intensity * coverage(glow_intensity) / coverage(1.0)
+    
     def _draw_eye_glow(self, surface: pygame.Surface, state: AnimationState) -> None:
         """Draw glowing effect on eyes when speaking using actual eye positions"""
         # Don't draw glow if eyes are mostly closed
         if state.eye_blink > 0.7:
             return
         
-        # Create a temporary surface for blending
-        glow_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        
         # Calculate glow intensity based on mouth_open (indicating speech activity)
         glow_intensity = min(1.0, state.mouth_open * 1.5)
         
         if glow_intensity > 0.1:
-            # Cyan/teal glow color (0, 200, 255) similar to the robot's eyes in the image
-            glow_color = (0, int(200 * glow_intensity), int(255 * glow_intensity), int(180 * glow_intensity))
-            
-            # Draw multiple circles for glow effect (outer layers)
-            num_layers = 3
-            for layer in range(num_layers):
-                layer_alpha = int(glow_color[3] * (1.0 - layer * 0.3))
-                layer_radius = int(self.eye_glow_radius * (1.0 + layer * 0.5))
-                
-                # Create glow color with alpha
-                layer_color = (glow_color[0], glow_color[1], glow_color[2], max(0, layer_alpha))
-
-                # Draw glow for eye at actual position
-                self._draw_glow_circle(glow_surface, self.eye_x, self.eye_y, layer_radius, layer_color)
+            level = int(255 * self._eye_glow_brightness(glow_intensity))
+            if level >= 255:
+                # Full intensity: the cached glow is added to the display as is
+                glow = self._eye_glow_cached
+            else:
+                # Scale the cached full-intensity glow (surface alpha doesn't apply to additive blits)
+                glow = self._eye_glow_scratch
+                glow.fill((level, level, level))
+                glow.blit(self._eye_glow_cached, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
             
-            # Blit the glow surface onto the main surface
-            surface.blit(glow_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+            # Blit the glow straight onto the main surface
+            surface.blit(glow, self._eye_glow_pos, special_flags=pygame.BLEND_ADD)
     
-    def _draw_glow_circle(self, surface: pygame.Surface, x: int, y: int, radius: int, color: tuple) -> None:
-        """Draw a glow circle with alpha blending"""
-        # Create a temporary surface for this circle
-        circle_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(circle_surface, color, (radius, radius), radius)
-        surface.blit(circle_surface, (x - radius, y - radius), special_flags=pygame.BLEND_ALPHA_SDL2)
+    @staticmethod
+    def _premultiply(color: tuple) -> tuple:
+        """Premultiply an RGBA color's channels by its alpha (what alpha-blending it over a cleared pixel gives)"""
+        r, g, b, a = color
+        return (r * a // 255, g * a // 255, b * a // 255, a)
+    
+    def _render_glow_disc(self, radius: int) -> pygame.Surface:
+        """Render a glow-colored disc, transparent outside via a black color key"""
+        disc = pygame.Surface((radius * 2, radius * 2))
+        disc.fill((0, 0, 0))
+        pygame.draw.circle(disc, self.GLOW_COLOR, (radius, radius), radius)
+        disc.set_colorkey((0, 0, 0))
+        return disc
+    
+    def _draw_glow_circle(self, surface: pygame.Surface, x: int, y: int, radius: int, alpha: int) -> None:
+        """Alpha-blend the cached glow disc of this radius onto the surface"""
+        disc = self._glow_cache[radius]
+        disc.set_alpha(alpha)
+        surface.blit(disc, (x - radius, y - radius))
 
     def _draw_multi_circle_animation(self, surface: pygame.Surface, state: AnimationState, is_speaking: bool) -> None:
         """
         Draw multi-circle glowing animation matching the central element design.
         Creates concentric rings with different patterns (solid, dashed, dotted) that glow.
         """
-        current_time = time.time() - self.animation_start_time
-        
-        # Create animation surface for blending
-        anim_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Clear the persistent animation surface for blending
+        anim_surface = self._anim_surface
+        anim_surface.fill((0, 0, 0, 0))
         
-        # Base glow color (cyan/blue to match the UI theme)
-        base_color = (0, 200, 255)  # Cyan
+        base_color = self.GLOW_COLOR
         
-        # Calculate pulsing glow intensity (breathing effect)
-        pulse_speed = 2.0  # Pulses per second
-        pulse_intensity = 0.5 + 0.5 * (1.0 + math.sin(current_time * pulse_speed * 3.14159)) / 2.0
+        # Calculate pulsing glow intensity (breathing effect) from the frame time the controller took
+        pulse_intensity = 0.5 + 0.5 * (1.0 + math.sin(state.elapsed * self.PULSE_RATE)) / 2.0
         
         # Enhance glow when speaking
         if is_speaking:
             pulse_intensity = min(1.0, pulse_intensity + 0.3)
         
-        # Define multiple concentric rings with different radii and styles
-        rings = [
-            # (radius, width, style, glow_intensity_multiplier)
-            # Inner rings - solid, brighter
-            (15, 2, 'solid', 1.0),
-            (25, 2, 'solid', 0.8),
-            # Middle rings - dashed
-            (35, 2, 'dashed', 0.7),
-            (45, 2, 'dashed', 0.6),
-            # Outer rings - dotted
-            (55, 1, 'dotted', 0.5),
-            (65, 1, 'dotted', 0.4),
-            (75, 1, 'dotted', 0.3),
-        ]
-        
-        # Draw each ring
-        for ring_radius, ring_width, style, intensity_mult in rings:
+        # Draw each ring (solid, dashed or dotted, as resolved in __init__)
+        for draw, draw_glow, intensity_mult in self._ring_draws:
             # Calculate ring glow with pulsing and individual intensity
             ring_glow = pulse_intensity * intensity_mult
             
             # Create color with alpha based on glow
             ring_alpha = int(200 * ring_glow)
-            ring_color = (*base_color, ring_alpha)
-            
-            # Calculate actual radius scaled to screen
-            scaled_radius = int(ring_radius * max(self.scale_x, self.scale_y))
-            scaled_width = max(1, int(ring_width * max(self.scale_x, self.scale_y)))
-            
-            # Draw ring based on style
-            if style == 'solid':
-                # Draw solid circle outline
-                self._draw_ring(anim_surface, self.animation_center_x, self.animation_center_y, 
-                               scaled_radius, scaled_width, ring_color)
-            elif style == 'dashed':
-                # Draw dashed circle (8 segments)
-                self._draw_dashed_ring(anim_surface, self.animation_center_x, self.animation_center_y,
-                                      scaled_radius, scaled_width, ring_color, num_segments=8)
-            elif style == 'dotted':
-                # Draw dotted circle
-                self._draw_dotted_ring(anim_surface, self.animation_center_x, self.animation_center_y,
-                                      scaled_radius, scaled_width, ring_color, num_dots=16)
+            draw((*base_color, ring_alpha))
             
             # Add outer glow layer for each ring
-            glow_radius = scaled_radius + scaled_width * 2
-            glow_alpha = int(ring_alpha * 0.3)
-            glow_color = (*base_color, glow_alpha)
-            self._draw_glow_circle(anim_surface, self.animation_center_x, self.animation_center_y,
-                                  glow_radius, glow_color)
+            draw_glow(int(ring_alpha * 0.3))
         
         # Blit the animation surface with additive blending for glow effect
-        surface.blit(anim_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+        surface.blit(anim_surface, self._anim_pos, special_flags=pygame.BLEND_ADD)
     
     def _draw_ring(self, surface: pygame.Surface, x: int, y: int, radius: int, width: int, color: tuple) -> None:
         """Draw a solid ring"""
-        # Draw multiple circles to create a smooth ring with width
-        for i in range(width):
-            r = radius - i
-            if r > 0:
-                # Create circle surface
-                circle_size = r * 2 + 2
-                circle_surf = pygame.Surface((circle_size, circle_size), pygame.SRCALPHA)
-                pygame.draw.circle(circle_surf, color, (r + 1, r + 1), r, 1)
-                surface.blit(circle_surf, (x - r - 1, y - r - 1), special_flags=pygame.BLEND_ALPHA_SDL2)
+        # One native thick-circle draw; rings land on cleared pixels, so the premultiplied color
+        # written directly equals alpha-blending it
+        pygame.draw.circle(surface, self._premultiply(color), (x, y), radius, width)
     
-    def _draw_dashed_ring(self, surface: pygame.Surface, x: int, y: int, radius: int, width: int, 
-                          color: tuple, num_segments: int = 8) -> None:
-        """Draw a dashed ring"""
+    @staticmethod
+    def _dash_points(x: int, y: int, radius: int, num_segments: int) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+        """Compute the polyline of each dash of a dashed ring, as int pixel tuples pygame takes directly"""
         segment_angle = 2 * math.pi / num_segments
         dash_length = segment_angle * 0.6  # Each dash is 60% of segment
+        num_points = 20
         
-        for i in range(num_segments):
-            start_angle = i * segment_angle
-            end_angle = start_angle + dash_length
-            
-            # Draw arc for this dash
-            points = []
-            num_points = 20
-            for j in range(num_points + 1):
-                angle = start_angle + (end_angle - start_angle) * (j / num_points)
-                px = x + radius * math.cos(angle)
-                py = y + radius * math.sin(angle)
-                points.append((int(px), int(py)))
-            
-            # Draw lines connecting points to create the dash
-            if len(points) > 1:
-                for j in range(len(points) - 1):
-                    pygame.draw.line(surface, color, points[j], points[j + 1], width)
+        # Angles of the points along one dash, shared by every dash
+        dash_angles = [dash_length * (j / num_points) for j in range(num_points + 1)]
+        return tuple(
+            tuple((int(x + radius * math.cos(i * segment_angle + angle)), int(y + radius * math.sin(i * segment_angle + angle)))
+                  for angle in dash_angles)
+            for i in range(num_segments)
+        )
     
-    def _draw_dotted_ring(self, surface: pygame.Surface, x: int, y: int, radius: int, width: int,
-                          color: tuple, num_dots: int = 16) -> None:
-        """Draw a dotted ring"""
+    @staticmethod
+    def _dot_points(x: int, y: int, radius: int, num_dots: int) -> Tuple[Tuple[int, int], ...]:
+        """Compute the dot centers of a dotted ring"""
         angle_step = 2 * math.pi / num_dots
-        
-        for i in range(num_dots):
-            angle = i * angle_step
-            dot_x = int(x + radius * math.cos(angle))
-            dot_y = int(y + radius * math.sin(angle))
-            pygame.draw.circle(surface, color, (dot_x, dot_y), width)
-
+        return tuple((int(x + radius * math.cos(i * angle_step)), int(y + radius * math.sin(i * angle_step)))
+                     for i in range(num_dots))
+    
+    def _draw_dashed_ring(self, surface: pygame.Surface, dashes: Tuple[Tuple[Tuple[int, int], ...], ...], width: int,
+                          color: tuple) -> None:
+        """Draw a dashed ring from its precomputed dash polylines"""
+        draw_lines = pygame.draw.lines
+        for points in dashes:
+            # One polyline call draws every segment of the dash
+            draw_lines(surface, color, False, points, width)
+    
+    def _draw_dotted_ring(self, surface: pygame.Surface, dots: Tuple[Tuple[int, int], ...], width: int,
+                          color: tuple) -> None:
+        """Draw a dotted ring from its precomputed dot centers"""
+        draw_circle = pygame.draw.circle
+        for dot in dots:
+            draw_circle(surface, color, dot, width)
@@ -3,8 +3,8 @@ Service client for UI to connect to pyjarvis_service
 """
 
 import asyncio
-import json
 import struct
+import orjson
 from typing import Optional, Callable
 from loguru import logger
 from pyjarvis_shared import (
@@ -15,6 +15,8 @@ from pyjarvis_shared import (
     ProcessingStatus,
     Emotion,
     AppConfig,
+    default_config,
+    read_payload,
 )
 
 
@@ -23,10 +25,11 @@ class ServiceClient:
     
     def __init__(self, config: Optional[AppConfig] = None):
         """Create a new service client"""
-        self.config = config or AppConfig()
+        self.config = config or default_config()
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
         self.update_callback: Optional[Callable[[VoiceProcessingUpdate], None]] = None
+        self.disconnect_callback: Optional[Callable[[], None]] = None  # Called when the broadcast listener stops
         self.listening_task: Optional[asyncio.Task] = None
         self.connected = False
         
@@ -126,16 +129,12 @@ class ServiceClient:
                     length_bytes = await self.reader.readexactly(4)
                     length = struct.unpack('<I', length_bytes)[0]
                     
-                    # Read message data in chunks if large
-                    data = await self._read_chunked(length)
-                    
-                    # Deserialize JSON
-                    response_dict = json.loads(data.decode('utf-8'))
-                    response = ServiceResponse(**response_dict)
+                    # Read the JSON envelope and raw audio (if any) straight into their own buffers
+                    response = self._decode_response(*await read_payload(self.reader, length))
                     
                     # Handle update
                     if response.response_type == "Update" and response.update and self.update_callback:
-                        update = self._parse_update(response.update)
+                        update = self._parse_update(response.update, response.audio_data)
                         logger.info(f"[UI] Received update: {update.status}")
                         self.update_callback(update)
                     
@@ -157,41 +156,24 @@ class ServiceClient:
             logger.debug(traceback.format_exc())
         finally:
             self.connected = False
-            # Notify callback that connection was lost
-            if self.update_callback:
+            # Notify the owner that the connection was lost
+            if self.disconnect_callback:
                 try:
-                    # Create a dummy update to signal connection loss
-                    # The UI should check service_client.connected to update status
-                    pass
-                except:
-                    pass
+                    self.disconnect_callback()
+                except Exception as e:
+                    logger.error(f"[UI] Disconnect callback failed: {e}")
             logger.info("[UI] Stopped listening for broadcasts - connection lost")
     
-    async def _read_chunked(self, length: int) -> bytes:
-        """Read data in chunks"""
-        chunk_size = 64 * 1024  # 64KB
-        if length > chunk_size:
-            data = b""
-            bytes_read = 0
-            while bytes_read < length:
-                chunk = await self.reader.readexactly(min(chunk_size, length - bytes_read))
-                data += chunk
-                bytes_read += len(chunk)
-            return data
-        else:
-            return await self.reader.readexactly(length)
-    
     async def _send_message(self, command: ServiceCommand) -> None:
         """Send a message to the service"""
         if not self.writer:
             raise ConnectionError("Not connected to service")
         
-        data = json.dumps(command.model_dump()).encode('utf-8')
-        length = len(data)
+        # Serialized to JSON bytes in one pass by Pydantic's Rust serializer
+        data = command.__pydantic_serializer__.to_json(command)
         
-        # Send length prefix
-        self.writer.write(struct.pack('<I', length))
-        self.writer.write(data)
+        # Send length prefix and data as one write (commands are small, so the copy is cheap)
+        self.writer.write(struct.pack('<I', len(data)) + data)
         await self.writer.drain()
     
     async def _receive_message(self) -> ServiceResponse:
@@ -203,40 +185,28 @@ class ServiceClient:
         length_bytes = await self.reader.readexactly(4)
         length = struct.unpack('<I', length_bytes)[0]
         
-        # Read data
-        data = await self._read_chunked(length)
-        
-        # Deserialize
-        response_dict = json.loads(data.decode('utf-8'))
-        return ServiceResponse(**response_dict)
+        # Read data and deserialize
+        return self._decode_response(*await read_payload(self.reader, length))
+    
+    def _decode_response(self, json_bytes: bytes, audio_data: Optional[bytes] = None) -> ServiceResponse:
+        """Decode a JSON envelope (plus the raw audio of a binary frame) to ServiceResponse"""
+        response_dict = orjson.loads(json_bytes)
+        return ServiceResponse(**response_dict, audio_data=audio_data)
     
-    def _parse_update(self, update_dict: dict) -> VoiceProcessingUpdate:
-        """Parse update dictionary to VoiceProcessingUpdate"""
-        # Parse status
-        status_str = update_dict.get("status", "Ready")
-        status = ProcessingStatus(status_str) if status_str in [s.value for s in ProcessingStatus] else ProcessingStatus.READY
+    def _parse_update(self, update_dict: dict, audio_data: Optional[bytes] = None) -> VoiceProcessingUpdate:
+        """Parse update dictionary (plus raw audio from a binary frame) to VoiceProcessingUpdate"""
+        # Parse status (enum value lookups go straight to the enum's own value -> member dict)
+        status = ProcessingStatus._value2member_map_.get(update_dict.get("status"), ProcessingStatus.READY)
         
         # Parse audio_file_path (preferred)
         audio_file_path = update_dict.get("audio_file_path")
         
-        # Parse audio_data (hex string) - backward compatibility
-        audio_data = None
-        if not audio_file_path:  # Only use audio_data if file_path not available
-            audio_hex = update_dict.get("audio_data")
-            if audio_hex:
-                try:
-                    audio_data = bytes.fromhex(audio_hex)
-                except Exception as e:
-                    logger.warning(f"[UI] Failed to parse audio_data: {e}")
+        # Raw audio only ever arrives in a binary frame (never hex in the JSON), and only without a file
+        if audio_file_path:
+            audio_data = None
         
         # Parse emotion
-        emotion = None
-        emotion_str = update_dict.get("emotion")
-        if emotion_str:
-            try:
-                emotion = Emotion(emotion_str)
-            except:
-                pass
+        emotion = Emotion._value2member_map_.get(update_dict.get("emotion"))
         
         # Parse subject
         subject = update_dict.get("subject")
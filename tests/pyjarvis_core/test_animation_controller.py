@@ -2,7 +2,7 @@
 Unit tests for pyjarvis_core.animation_controller module
 """
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from pyjarvis_core.animation_controller import AnimationController
 from pyjarvis_shared import Emotion
 
@@ -41,5 +41,20 @@ class TestAnimationController:
         assert controller.emotion == Emotion.HAPPY
         controller.set_emotion(Emotion.NEUTRAL)
         assert controller.emotion == Emotion.NEUTRAL
-
-
+    
+    def test_active_while_blinking_or_speaking(self, controller):
+        """Test the controller reports activity only while the face is moving"""
+        assert controller.active is False
+        controller.update(0.016, audio_level=1.0)
+        assert controller.active is True
+        controller.state.mouth_open = 0.0
+        controller.state.is_blinking = True
+        assert controller.active is True
+    
+    def test_update_records_frame_time(self, controller):
+        """Test update() reads the clock once and records the elapsed time on the state"""
+        with patch('pyjarvis_core.animation_controller.time.time', return_value=controller._start_time + 2.5) as mock_time:
+            controller.update(0.016)
+        
+        assert controller.state.elapsed == 2.5
+        mock_time.assert_called_once()
@@ -62,5 +62,31 @@ class TestTextAnalyzer:
         assert language is not None
         assert isinstance(emotion, Emotion)
         assert isinstance(language, Language)
-
-
+    
+    @pytest.mark.asyncio
+    async def test_language_detection_loads_supported_profiles_only(self, analyzer):
+        """Test only the supported languages' profiles are loaded"""
+        await analyzer._initialize_language_detection()
+        assert sorted(analyzer._language_pipeline.get_lang_list()) == ["en", "es", "pt"]
+        assert await analyzer.detect_language("Eu gostaria de saber como está o tempo hoje") == Language.PORTUGUESE
+        assert await analyzer.detect_language("Me gustaría saber qué tiempo hace hoy") == Language.SPANISH
+    
+    @pytest.mark.asyncio
+    async def test_language_profiles_shared_across_analyzers(self, analyzer):
+        """Test every analyzer reuses the one process-wide detector factory"""
+        other = TextAnalyzer()
+        await analyzer._initialize_language_detection()
+        await other._initialize_language_detection()
+        assert other._language_pipeline is analyzer._language_pipeline
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("code, text, expected", [
+        ("en-GB", "Hello, world!", Language.ENGLISH),
+        ("pt-BR", "Olá, mundo!", Language.PORTUGUESE),
+        ("es-MX", "Hola, mundo", Language.SPANISH),
+        ("fr", "Você está aí?", Language.PORTUGUESE),  # Unknown code falls back to heuristics
+    ])
+    async def test_detect_language_maps_detector_codes(self, analyzer, code, text, expected):
+        """Test detected language codes map to Language members without running the detector"""
+        with patch.object(TextAnalyzer, "_detect_language_code", return_value=code):
+            assert await analyzer.detect_language(text) == expected
@@ -2,6 +2,7 @@
 Unit tests for pyjarvis_core.tts_factory module
 """
 import pytest
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import Mock, patch
 from pyjarvis_core.tts_factory import TtsProcessorFactory
@@ -28,7 +29,7 @@ class TestTtsProcessorFactory:
         """Test creating a gTTS processor"""
         output_dir = Path("./test_audio")
         # Temporarily change processor type
-        app_config.tts_processor = "gtts"
+        app_config = replace(app_config, tts_processor="gtts")
         processor = TtsProcessorFactory.create(app_config, output_dir=output_dir)
         assert processor is not None
         assert processor.name == "gTTS"
@@ -43,7 +44,7 @@ class TestTtsProcessorFactory:
         """Test creating an unknown processor falls back to default"""
         output_dir = Path("./test_audio")
         # Unknown processor should fall back to default (gtts)
-        app_config.tts_processor = "unknown-processor"
+        app_config = replace(app_config, tts_processor="unknown-processor")
         processor = TtsProcessorFactory.create(app_config, output_dir=output_dir)
         assert processor is not None
         # Should fall back to gtts
@@ -0,0 +1,22 @@
+"""
+Shared fixtures for the TTS processor tests
+"""
+import pytest
+from unittest.mock import MagicMock
+
+
+@pytest.fixture(scope="module")
+def fake_tmp_path(tmp_path_factory) -> str:
+    """Provide one scratch MP3 path per module, for a patched tempfile.NamedTemporaryFile to hand out"""
+    path = tmp_path_factory.mktemp("tts") / "tmp.mp3"
+    path.touch()
+    return str(path)
+
+
+@pytest.fixture
+def mock_named_temporary_file(fake_tmp_path) -> MagicMock:
+    """Provide a NamedTemporaryFile replacement whose file is fake_tmp_path"""
+    mock_file = MagicMock()
+    mock_file.name = fake_tmp_path
+    mock_file.__enter__.return_value = mock_file
+    return MagicMock(return_value=mock_file)
@@ -47,5 +47,34 @@ class TestTtsProcessor:
         assert callable(processor.synthesize)
         assert hasattr(processor, 'initialize')
         assert hasattr(processor, 'name')
-
-
+    
+    def test_get_output_path_in_output_dir(self, processor):
+        """Test output files are placed directly in the output directory"""
+        output_path = processor._get_output_path("test", Language.ENGLISH)
+        assert output_path.parent == processor.output_dir
+        assert output_path.name.startswith("tts_en_")
+        assert output_path.suffix == ".wav"
+    
+    @pytest.mark.asyncio
+    async def test_synthesize_batch_default(self, processor):
+        """Test the default batch synthesis returns one result or exception per text"""
+        original = processor.synthesize
+        
+        async def synthesize(text, language):
+            if not text:
+                raise ValueError("empty text")
+            return await original(text, language)
+        
+        processor.synthesize = synthesize
+        results = await processor.synthesize_batch(["hi", ""], [Language.ENGLISH, Language.SPANISH])
+        
+        assert isinstance(results[0], TtsProcessorResult)
+        assert results[0].language == Language.ENGLISH
+        assert isinstance(results[1], ValueError)
+    
+    @pytest.mark.asyncio
+    async def test_synthesize_batch_identical_texts_get_distinct_paths(self, processor):
+        """Test identical texts in one batch are written to different files"""
+        results = await processor.synthesize_batch(["hi", "hi"], [Language.ENGLISH, Language.ENGLISH])
+        
+        assert results[0].audio_file_path != results[1].audio_file_path
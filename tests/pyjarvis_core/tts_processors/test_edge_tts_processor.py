@@ -3,11 +3,18 @@ Unit tests for pyjarvis_core.tts_processors.edge_tts_processor module
 """
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock
 from pyjarvis_core.tts_processors.edge_tts_processor import EdgeTtsProcessor
 from pyjarvis_shared import AppConfig, Language
 
 
+async def _audio_stream():
+    """Fake Communicate.stream() output: audio chunks mixed with metadata"""
+    yield {"type": "audio", "data": b"ID3"}
+    yield {"type": "WordBoundary", "offset": 0}
+    yield {"type": "audio", "data": b"\x00" * 16}
+
+
 class TestEdgeTtsProcessor:
     """Tests for EdgeTtsProcessor class"""
     
@@ -17,78 +24,33 @@ class TestEdgeTtsProcessor:
         output_dir = Path("./test_audio")
         return EdgeTtsProcessor(output_dir, config=app_config)
     
+    @pytest.fixture
+    def edge_tts_mocks(self, monkeypatch, mock_named_temporary_file):
+        """Patch Edge TTS and the file operations synthesize() performs"""
+        mock_communicate_class = Mock()
+        mock_communicate_class.return_value.stream = Mock(return_value=_audio_stream())
+        monkeypatch.setattr("edge_tts.Communicate", mock_communicate_class)
+        monkeypatch.setattr("tempfile.NamedTemporaryFile", mock_named_temporary_file)
+        monkeypatch.setattr("os.path.exists", lambda path: True)
+        monkeypatch.setattr("os.unlink", lambda path: None)
+        monkeypatch.setattr("shutil.move", lambda *args: None)
+        return mock_communicate_class
+    
     def test_processor_initialization(self, processor, app_config):
         """Test EdgeTtsProcessor initialization"""
         assert processor.config == app_config
         assert processor.output_dir == Path("./test_audio")
     
     @pytest.mark.asyncio
-    async def test_synthesize_text(self, processor):
-        """Test synthesizing text to speech"""
-        import tempfile
-        import os
-        
-        with patch('edge_tts.Communicate') as mock_communicate_class:
-            mock_communicate = AsyncMock()
-            mock_communicate_class.return_value = mock_communicate
-            mock_communicate.save = AsyncMock()
-            
-            # Create a real temporary file path
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp_file:
-                tmp_path = tmp_file.name
-            
-            try:
-                with patch('tempfile.NamedTemporaryFile') as mock_temp:
-                    mock_file = Mock()
-                    mock_file.name = tmp_path
-                    mock_file.__enter__ = Mock(return_value=mock_file)
-                    mock_file.__exit__ = Mock(return_value=None)
-                    mock_temp.return_value = mock_file
-                    
-                    with patch('os.path.exists', return_value=True):
-                        with patch('os.unlink'):
-                            with patch('shutil.move'):
-                                result = await processor.synthesize("Hello, world!", Language.ENGLISH)
-                                assert result is not None
-                                assert result.language == Language.ENGLISH
-            finally:
-                # Clean up
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
-    
-    @pytest.mark.asyncio
-    async def test_synthesize_with_language(self, processor):
-        """Test synthesizing with specific language"""
-        import tempfile
-        import os
-        
-        with patch('edge_tts.Communicate') as mock_communicate_class:
-            mock_communicate = AsyncMock()
-            mock_communicate_class.return_value = mock_communicate
-            mock_communicate.save = AsyncMock()
-            
-            # Create a real temporary file path
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp_file:
-                tmp_path = tmp_file.name
-            
-            try:
-                with patch('tempfile.NamedTemporaryFile') as mock_temp:
-                    mock_file = Mock()
-                    mock_file.name = tmp_path
-                    mock_file.__enter__ = Mock(return_value=mock_file)
-                    mock_file.__exit__ = Mock(return_value=None)
-                    mock_temp.return_value = mock_file
-                    
-                    with patch('os.path.exists', return_value=True):
-                        with patch('os.unlink'):
-                            with patch('shutil.move'):
-                                result = await processor.synthesize("Hello", Language.PORTUGUESE)
-                                assert result is not None
-                                assert result.language == Language.PORTUGUESE
-            finally:
-                # Clean up
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+    @pytest.mark.parametrize("language", [Language.ENGLISH, Language.PORTUGUESE])
+    async def test_synthesize(self, processor, edge_tts_mocks, fake_tmp_path, language):
+        """Test synthesizing text to speech in each language"""
+        result = await processor.synthesize("Hello, world!", language)
+        assert result is not None
+        assert result.language == language
+        # Only the audio chunks of the stream are written
+        with open(fake_tmp_path, 'rb') as written:
+            assert written.read() == b"ID3" + b"\x00" * 16
     
     def test_get_voice_for_language(self, processor):
         """Test getting voice for a specific language"""
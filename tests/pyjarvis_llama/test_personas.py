@@ -34,6 +34,26 @@ class TestPersonaFactory:
         assert isinstance(personas, list)
         assert len(personas) > 0
         assert "jarvis" in personas
+    
+    def test_create_reuses_instance(self):
+        """Test personas are stateless and shared between create calls"""
+        assert PersonaFactory.create("Jarvis") is PersonaFactory.create("jarvis")
+    
+    def test_register_persona(self, monkeypatch):
+        """Test registering a new persona keeps the registry read-only"""
+        monkeypatch.setattr(PersonaFactory, "_personas", PersonaFactory._personas)
+        monkeypatch.setattr(PersonaFactory, "_instances", dict(PersonaFactory._instances))
+        
+        class CustomPersona(JarvisPersona):
+            @property
+            def name(self) -> str:
+                return "custom"
+        
+        PersonaFactory.register("Custom", CustomPersona)
+        assert "custom" in PersonaFactory.list_available()
+        assert isinstance(PersonaFactory.create("custom"), CustomPersona)
+        with pytest.raises(TypeError):
+            PersonaFactory._personas["other"] = CustomPersona
 
 
 class TestPersonaStrategy:
@@ -55,5 +75,16 @@ class TestPersonaStrategy:
         assert formatted is not None
         assert isinstance(formatted, str)
         assert "Hello" in formatted
-
+    
+    def test_build_blocks_static_prefix(self):
+        """Test static blocks come first and only per-turn blocks vary"""
+        strategy = JarvisPersona()
+        blocks = strategy.build_blocks("Hello", memory_snippets=["Earlier chat"])
+        assert [name for name, _, _ in blocks] == ["persona", "style", "memory", "user"]
+        assert [cacheable for _, _, cacheable in blocks] == [True, True, False, False]
+        
+        other = strategy.build_blocks("Bye")
+        assert other[:2] == blocks[:2]
+        assert [name for name, _, _ in other] == ["persona", "style", "user"]
+        assert strategy.build_prompt("Hello", ["Earlier chat"]) == "\n\n".join(c for _, c, _ in blocks)
 
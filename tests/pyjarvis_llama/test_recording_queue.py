@@ -6,7 +6,12 @@ import uuid
 from unittest.mock import Mock, AsyncMock, patch
 from pyjarvis_llama.recording_queue import (
     AudioRecordingQueue,
+    AsyncAudioRecordingQueue,
+    get_async_recording_queue,
+    shutdown_async_recording_queue,
     RecordingStatus,
+    _ChunkDeduplicator,
+    _NOOP,
     RecordingTask,
     RecordingResult
 )
@@ -69,3 +74,78 @@ class TestRecordingQueue:
         assert hasattr(queue, 'submit_task')
 
 
+class TestRecordingTask:
+    """Tests for RecordingTask dataclass"""
+    
+    def test_callbacks_default_to_noop(self):
+        """Test missing callbacks are replaced by a callable no-op"""
+        task = RecordingTask(task_id="t1", config=AppConfig(), language="en", on_text_chunk=None)
+        assert task.on_status_update is _NOOP
+        assert task.on_text_chunk is _NOOP
+        task.on_status_update(RecordingStatus.RECORDING)  # Must not raise
+
+
+class TestChunkDeduplicator:
+    """Tests for _ChunkDeduplicator class"""
+    
+    def test_detects_repeated_chunks(self):
+        """Test repeated chunks are flagged regardless of case"""
+        dedup = _ChunkDeduplicator()
+        assert dedup.is_duplicate("Hello there") is False
+        assert dedup.is_duplicate("hello there") is True
+        assert dedup.is_duplicate("General Kenobi") is False
+    
+    def test_window_is_bounded(self):
+        """Test only the most recent chunks are remembered"""
+        dedup = _ChunkDeduplicator(window=2)
+        for text in ("one", "two", "three"):
+            assert dedup.is_duplicate(text) is False
+        assert len(dedup._seen) == 2
+        assert dedup.is_duplicate("one") is False
+        assert dedup.is_duplicate("three") is True
+    
+    def test_crc_collision_is_not_a_duplicate(self):
+        """Test different chunks sharing a CRC32 are both kept"""
+        dedup = _ChunkDeduplicator()
+        assert dedup.is_duplicate("plumless") is False
+        assert dedup.is_duplicate("buckeroo") is False
+
+
+class TestAsyncRecordingQueue:
+    """Tests for AsyncAudioRecordingQueue class"""
+    
+    @pytest.fixture
+    def queue(self):
+        """Create an AsyncAudioRecordingQueue instance"""
+        queue = AsyncAudioRecordingQueue()
+        yield queue
+        queue.shutdown()
+    
+    def test_create_task(self, queue):
+        """Test creating a recording task"""
+        task = queue.create_task(config=AppConfig(), language="en")
+        assert isinstance(task, RecordingTask)
+        assert task.task_id
+        assert task.language == "en"
+    
+    @pytest.mark.asyncio
+    async def test_submit_returns_result(self, queue):
+        """Test submit awaits the recording and returns its result directly"""
+        task = queue.create_task(config=AppConfig(), language="en")
+        expected = RecordingResult(task_id=task.task_id, success=True, transcribed_text="hello")
+        
+        with patch.object(queue, '_process_recording_task', return_value=expected) as mock_process:
+            result = await queue.submit(task)
+        
+        mock_process.assert_called_once_with(task)
+        assert result is expected
+        assert task.task_id not in queue._result_store
+    
+    def test_shutdown_releases_singleton(self):
+        """Test shutting down the shared queue frees its executor and a new one is created next time"""
+        queue = get_async_recording_queue()
+        shutdown_async_recording_queue()
+        
+        assert queue._executor._shutdown
+        assert get_async_recording_queue() is not queue
+        shutdown_async_recording_queue()
@@ -1,6 +1,8 @@
 """
 Unit tests for pyjarvis_service.ipc module
 """
+import asyncio
+import json
 import pytest
 import struct
 from unittest.mock import Mock, AsyncMock, patch
@@ -91,10 +93,180 @@ class TestIpcServer:
         # Add a mock subscriber
         mock_writer = AsyncMock()
         mock_writer.drain = AsyncMock()
-        ipc_server.broadcast_subscribers.add(mock_writer)
+        mock_writer.is_closing = Mock(return_value=False)
+        ipc_server.broadcast_subscribers.append(mock_writer)
         
         await ipc_server._broadcast_update(update)
         # Verify drain was called (update was sent)
         assert mock_writer.drain.called or len(ipc_server.broadcast_subscribers) > 0
+    
+    @pytest.mark.asyncio
+    async def test_send_tcp_message_single_write(self, ipc_server):
+        """Test small responses are sent as one length-prefixed write"""
+        from pyjarvis_shared import ServiceResponse
+        mock_writer = Mock()
+        mock_writer.drain = AsyncMock()
+        
+        await ipc_server._send_tcp_message(mock_writer, ServiceResponse.pong())
+        
+        mock_writer.write.assert_called_once()
+        frame = mock_writer.write.call_args[0][0]
+        length = struct.unpack_from('<I', frame)[0]
+        assert length == len(frame) - 4
+        mock_writer.drain.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_send_tcp_message_large_payload(self, ipc_server):
+        """Test large responses are sent with one writelines call"""
+        from pyjarvis_shared import ServiceResponse
+        mock_writer = Mock()
+        mock_writer.drain = AsyncMock()
+        
+        await ipc_server._send_tcp_message(mock_writer, ServiceResponse.create_error("x" * 200_000))
+        
+        mock_writer.write.assert_not_called()
+        mock_writer.writelines.assert_called_once()
+        parts = mock_writer.writelines.call_args[0][0]
+        frame = b"".join(bytes(part) for part in parts)
+        assert struct.unpack_from('<I', frame)[0] == len(frame) - 4
+        mock_writer.drain.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once(self, ipc_server):
+        """Test a broadcast is serialized once and the same frame fans out"""
+        from pyjarvis_shared import VoiceProcessingUpdate, ProcessingStatus
+        from pyjarvis_service import ipc
+        update = VoiceProcessingUpdate(status=ProcessingStatus.READY)
+        
+        writers = []
+        for _ in range(3):
+            writer = Mock()
+            writer.drain = AsyncMock()
+            writer.is_closing = Mock(return_value=False)
+            writers.append(writer)
+            ipc_server.broadcast_subscribers.append(writer)
+        
+        with patch.object(ipc, '_serialize_response', wraps=ipc._serialize_response) as mock_serialize:
+            await ipc_server._broadcast_update(update)
+        
+        mock_serialize.assert_called_once()
+        frames = {writer.write.call_args[0][0] for writer in writers}
+        assert len(frames) == 1
+        for writer in writers:
+            writer.drain.assert_awaited_once()
 
-
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("split", [None, 6])
+    async def test_handle_tcp_connection_buffered_read(self, ipc_server, split):
+        """Test a command is parsed whether it arrives in one read or split across reads"""
+        ipc_server.processor = Mock(spec=TextProcessor)
+        ipc_server.running = True
+        
+        command_json = b'{"command_type":"Ping"}'
+        message = struct.pack('<I', len(command_json)) + command_json
+        reader = asyncio.StreamReader()
+        if split is None:
+            reader.feed_data(message)
+        else:
+            reader.feed_data(message[:split])
+            asyncio.get_running_loop().call_later(0.01, reader.feed_data, message[split:])
+        
+        writer = Mock()
+        writer.get_extra_info.return_value = ('127.0.0.1', 12345)
+        writer.drain = AsyncMock()
+        writer.wait_closed = AsyncMock()
+        
+        await asyncio.wait_for(ipc_server._handle_tcp_connection(reader, writer), timeout=1)
+        
+        frame = writer.write.call_args[0][0]
+        length = struct.unpack_from('<I', frame)[0]
+        assert json.loads(frame[4:4 + length])["response_type"] == "Pong"
+        writer.write_eof.assert_called_once()
+    
+    def test_static_frames_match_serialized_responses(self):
+        """Test the cached Ack/Pong frames equal freshly serialized responses"""
+        from pyjarvis_service.ipc import _ACK_FRAME, _PONG_FRAME, _serialize_response
+        from pyjarvis_shared import ServiceResponse
+        
+        assert _ACK_FRAME == _serialize_response(ServiceResponse.ack())
+        assert _PONG_FRAME == _serialize_response(ServiceResponse.pong())
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_closing_and_failed_clients(self, ipc_server):
+        """Test closing peers are skipped and failed peers are unsubscribed"""
+        from pyjarvis_shared import VoiceProcessingUpdate, ProcessingStatus
+        update = VoiceProcessingUpdate(status=ProcessingStatus.READY)
+        
+        healthy, closing, failing = Mock(), Mock(), Mock()
+        for writer in (healthy, closing, failing):
+            writer.drain = AsyncMock()
+            writer.is_closing = Mock(return_value=False)
+        closing.is_closing.return_value = True
+        failing.drain.side_effect = ConnectionResetError()
+        ipc_server.broadcast_subscribers.extend([healthy, closing, failing])
+        
+        await ipc_server._broadcast_update(update)
+        
+        closing.write.assert_not_called()
+        healthy.drain.assert_awaited_once()
+        assert ipc_server.broadcast_subscribers == [healthy]
+    
+    @pytest.mark.asyncio
+    async def test_handle_tcp_connection_times_out_partial_message(self, ipc_server, monkeypatch):
+        """Test a client that stalls mid-message is disconnected"""
+        from pyjarvis_service import ipc
+        monkeypatch.setattr(ipc, "_MESSAGE_TIMEOUT", 0.05)
+        ipc_server.running = True
+        
+        reader = asyncio.StreamReader()
+        reader.feed_data(struct.pack('<I', 100) + b'{"comm')
+        writer = Mock()
+        writer.get_extra_info.return_value = ('127.0.0.1', 12345)
+        writer.wait_closed = AsyncMock()
+        
+        await asyncio.wait_for(ipc_server._handle_tcp_connection(reader, writer), timeout=1)
+        
+        writer.write.assert_not_called()
+        writer.close.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_handle_tcp_connection_pipelined_commands(self, ipc_server):
+        """Test back-to-back commands in one read are each answered"""
+        ipc_server.processor = Mock(spec=TextProcessor)
+        ipc_server.running = True
+        
+        register = b'{"command_type":"RegisterUI"}'
+        ping = b'{"command_type":"Ping"}'
+        reader = asyncio.StreamReader()
+        reader.feed_data(
+            struct.pack('<I', len(register)) + register + struct.pack('<I', len(ping)) + ping
+        )
+        reader.feed_eof()
+        
+        writer = Mock()
+        writer.get_extra_info.return_value = ('127.0.0.1', 12345)
+        writer.drain = AsyncMock()
+        writer.wait_closed = AsyncMock()
+        
+        await asyncio.wait_for(ipc_server._handle_tcp_connection(reader, writer), timeout=1)
+        
+        replies = [call[0][0] for call in writer.write.call_args_list]
+        assert [json.loads(frame[4:])["response_type"] for frame in replies] == ["Ack", "Pong"]
+    
+    @pytest.mark.asyncio
+    async def test_serialize_offloads_large_audio(self, ipc_server):
+        """Test large audio frames are built on the serializer pool"""
+        from pyjarvis_shared import ServiceResponse
+        from pyjarvis_service.ipc import _SERIALIZE_OFFLOAD_SIZE, _serialize_response
+        response = ServiceResponse(response_type="Update", audio_data=b"\x01" * _SERIALIZE_OFFLOAD_SIZE)
+        
+        await ipc_server._serialize(ServiceResponse.pong())
+        assert ipc_server._ser_executor is None
+        
+        frame = await ipc_server._serialize(response)
+        
+        assert ipc_server._ser_executor is not None
+        assert frame == _serialize_response(response)
+        ipc_server.stop()
+        assert ipc_server._ser_executor is None
@@ -46,6 +46,51 @@ class TestTextProcessor:
             assert result is not None
             assert result.status == ProcessingStatus.READY
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("code, expected", [
+        ("PT-BR", "Portuguese"),
+        ("español", "Spanish"),
+        ("en-gb", "English"),
+        ("Spanish", "Spanish"),
+    ])
+    async def test_process_language_alias(self, processor, code, expected):
+        """Test provided language aliases skip detection"""
+        from pyjarvis_shared import Emotion
+        from pyjarvis_core.tts_processors.base import TtsProcessorResult
+        from pathlib import Path
+        request = TextToVoiceRequest(text="Hello", language=code)
+        
+        with patch.object(processor.text_analyzer, 'detect_emotion', AsyncMock(return_value=Emotion.NEUTRAL)), \
+             patch.object(processor.text_analyzer, 'detect_language', AsyncMock()) as mock_language, \
+             patch.object(processor.text_analyzer, 'extract_subject', AsyncMock(return_value=None)), \
+             patch.object(processor.tts_processor, 'synthesize', AsyncMock()) as mock_synthesize:
+            mock_synthesize.return_value = TtsProcessorResult(
+                audio_file_path=Path("test_audio.wav"),
+                sample_rate=44100,
+                duration_seconds=1.0,
+                language=None
+            )
+            
+            await processor.process(request)
+            
+            mock_language.assert_not_called()
+            assert mock_synthesize.call_args[0][1].value == expected
+    
+    @pytest.mark.asyncio
+    async def test_repeated_text_uses_analysis_cache(self, processor):
+        """Test analysing the same text twice only runs the analyzer once"""
+        from pyjarvis_shared import Emotion, Language
+        request = TextToVoiceRequest(text="Hello")
+        
+        with patch.object(processor.text_analyzer, 'detect_emotion', AsyncMock(return_value=Emotion.NEUTRAL)) as mock_emotion, \
+             patch.object(processor.text_analyzer, 'detect_language', AsyncMock(return_value=Language.ENGLISH)), \
+             patch.object(processor.text_analyzer, 'extract_subject', AsyncMock(return_value=None)):
+            first = await processor._analyze(request)
+            second = await processor._analyze(TextToVoiceRequest(text="Hello"))
+        
+        assert first == second == (Emotion.NEUTRAL, Language.ENGLISH, None)
+        mock_emotion.assert_awaited_once()
+    
     @pytest.mark.asyncio
     async def test_analyze_text(self, processor):
         """Test text analysis"""
@@ -0,0 +1,137 @@
+"""
+Unit tests for pyjarvis_service.request_pool module
+"""
+import asyncio
+import pytest
+from pyjarvis_service.request_pool import RequestPool
+from pyjarvis_shared import TextToVoiceRequest
+
+
+class TestRequestPool:
+    """Tests for RequestPool class"""
+
+    @pytest.mark.asyncio
+    async def test_requests_flow_through_modules(self):
+        """Test each module's output is passed on and the last one resolves the request"""
+        async def upper(items):
+            return [item.request.text.upper() for item in items]
+
+        async def exclaim(items):
+            return [item.state + "!" for item in items]
+
+        pool = RequestPool([upper, exclaim])
+        try:
+            result = await pool.submit(TextToVoiceRequest(text="hello"))
+            assert result == "HELLO!"
+            assert pool.pool_items == {}
+        finally:
+            pool.close()
+
+    @pytest.mark.asyncio
+    async def test_requests_arriving_while_busy_are_batched(self):
+        """Test requests queued behind a busy module go through it as one batch"""
+        batch_sizes = []
+        release = asyncio.Event()
+
+        async def analyze(items):
+            batch_sizes.append(len(items))
+            await release.wait()
+            return [item.request.text for item in items]
+
+        pool = RequestPool([analyze])
+        try:
+            first = asyncio.ensure_future(pool.submit(TextToVoiceRequest(text="a")))
+            await asyncio.sleep(0)
+            rest = [asyncio.ensure_future(pool.submit(TextToVoiceRequest(text=t))) for t in "bc"]
+            await asyncio.sleep(0)
+            release.set()
+
+            assert await asyncio.gather(first, *rest) == ["a", "b", "c"]
+            assert batch_sizes == [1, 2]
+        finally:
+            pool.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_window_collects_late_arrivals(self):
+        """Test a module with a batch window waits for requests arriving shortly after"""
+        batch_sizes = []
+
+        async def synthesize(items):
+            batch_sizes.append(len(items))
+            return [item.request.text for item in items]
+
+        pool = RequestPool([synthesize], max_batch=2, batch_windows=[0.05])
+        try:
+            first = asyncio.ensure_future(pool.submit(TextToVoiceRequest(text="a")))
+            await asyncio.sleep(0.01)
+            rest = [asyncio.ensure_future(pool.submit(TextToVoiceRequest(text=t))) for t in "bc"]
+
+            assert await asyncio.gather(first, *rest) == ["a", "b", "c"]
+            assert batch_sizes == [2, 1]
+        finally:
+            pool.close()
+
+    @pytest.mark.asyncio
+    async def test_item_failure_is_isolated(self):
+        """Test an exception for one item fails only that request"""
+        async def check(items):
+            return [ValueError("empty") if not item.request.text else item.request.text for item in items]
+
+        pool = RequestPool([check])
+        try:
+            ok = asyncio.ensure_future(pool.submit(TextToVoiceRequest(text="ok")))
+            bad = asyncio.ensure_future(pool.submit(TextToVoiceRequest(text="")))
+
+            assert await ok == "ok"
+            with pytest.raises(ValueError):
+                await bad
+        finally:
+            pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_leaves_the_pool(self):
+        """Test a request whose caller stopped waiting is dropped before its batch runs"""
+        batches = []
+
+        async def synthesize(items):
+            batches.append([item.request.text for item in items])
+            return [item.request.text for item in items]
+
+        pool = RequestPool([synthesize], batch_windows=[0.05])
+        try:
+            dropped = asyncio.ensure_future(pool.submit(TextToVoiceRequest(text="a")))
+            kept = asyncio.ensure_future(pool.submit(TextToVoiceRequest(text="b")))
+            await asyncio.sleep(0)
+            dropped.cancel()
+
+            assert await kept == "b"
+            assert batches == [["b"]]
+            assert pool.pool_items == {}
+        finally:
+            pool.close()
+
+    def test_requests_from_a_previous_loop_fail_on_restart(self):
+        """Test moving the pool to a new loop fails requests left on the old one"""
+        async def stall(items):
+            await asyncio.Event().wait()
+
+        pool = RequestPool([stall])
+        old_loop = asyncio.new_event_loop()
+        try:
+            pending = old_loop.create_task(pool.submit(TextToVoiceRequest(text="a")))
+            old_loop.run_until_complete(asyncio.sleep(0.01))
+            future = next(iter(pool.pool_items.values())).future
+
+            async def restart():
+                pool._ensure_running(asyncio.get_running_loop())
+
+            new_loop = asyncio.new_event_loop()
+            try:
+                new_loop.run_until_complete(restart())
+            finally:
+                pool.close()
+                new_loop.close()
+            assert isinstance(future.exception(), RuntimeError)
+            pending.cancel()
+        finally:
+            old_loop.close()
@@ -2,7 +2,8 @@
 Unit tests for pyjarvis_shared.config module
 """
 import pytest
-from pyjarvis_shared import AppConfig, AudioConfig
+from dataclasses import FrozenInstanceError
+from pyjarvis_shared import AppConfig, AudioConfig, default_config
 
 
 class TestAudioConfig:
@@ -64,5 +65,24 @@ class TestAppConfig:
         # Check actual default values from config.py
         assert app_config.edge_tts_voices["pt-br"] == "pt-BR-LeilaNeural"
         assert app_config.edge_tts_voices["en"] == "en-US-AnaNeural"
-
-
+    
+    def test_default_config_is_shared(self):
+        """Test default_config returns one shared default AppConfig"""
+        config = default_config()
+        assert config is default_config()
+        assert config.tcp_port == AppConfig().tcp_port
+    
+    def test_default_config_is_frozen(self):
+        """Test the shared default config cannot be mutated"""
+        config = default_config()
+        with pytest.raises(FrozenInstanceError):
+            config.tcp_port = 9999
+        with pytest.raises(FrozenInstanceError):
+            config.audio_config.sample_rate = 22050
+    
+    def test_default_edge_tts_voices_are_read_only(self):
+        """Test the default voice mapping is shared and cannot be mutated"""
+        config = AppConfig()
+        assert config.edge_tts_voices is AppConfig().edge_tts_voices
+        with pytest.raises(TypeError):
+            config.edge_tts_voices["en"] = "other"
@@ -0,0 +1,53 @@
+"""
+Unit tests for pyjarvis_shared.framing module
+"""
+import pytest
+import struct
+from pyjarvis_shared import pack_frame, unpack_payload, read_payload
+
+
+class TestFraming:
+    """Tests for payload framing helpers"""
+    
+    def test_json_payload_unchanged(self):
+        """Test payloads without audio stay plain JSON"""
+        json_bytes = b'{"response_type":"Ack"}'
+        payload = pack_frame(json_bytes)[4:]
+        assert payload == json_bytes
+        assert unpack_payload(payload) == (json_bytes, None)
+    
+    def test_binary_frame_roundtrip(self):
+        """Test raw audio is carried after the JSON envelope"""
+        json_bytes = b'{"response_type":"Update"}'
+        audio = bytes(range(256)) * 4
+        payload = pack_frame(json_bytes, audio)[4:]
+        assert len(payload) == 5 + len(json_bytes) + len(audio)
+        assert unpack_payload(payload) == (json_bytes, audio)
+    
+    @pytest.mark.parametrize("audio", [None, bytes(range(256)) * 4])
+    def test_frame_length_prefix(self, audio):
+        """Test the length prefix covers exactly the payload"""
+        frame = pack_frame(b'{"response_type":"Update"}', audio)
+        assert struct.unpack_from('<I', frame)[0] == len(frame) - 4
+    
+    def test_truncated_binary_frame(self):
+        """Test a truncated binary frame is rejected"""
+        payload = pack_frame(b'{"response_type":"Update"}', b"\x00\x01")[4:]
+        with pytest.raises(ValueError):
+            unpack_payload(payload[:8])
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("json_bytes, audio", [
+        (b'{"response_type":"Update"}', bytes(range(256)) * 4),
+        (b'{"response_type":"Update"}', bytes(range(256)) * 1024),
+        (b'{"response_type":"Ack"}', None),
+        (b'{"error":"' + b'x' * 100000 + b'"}', None),
+    ])
+    async def test_read_payload_from_stream(self, json_bytes, audio):
+        """Test payloads read from a stream split the same way as unpack_payload"""
+        import asyncio
+        payload = pack_frame(json_bytes, audio)[4:]
+        reader = asyncio.StreamReader()
+        reader.feed_data(payload)
+        
+        assert await read_payload(reader, len(payload)) == (json_bytes, audio)
@@ -44,6 +44,14 @@ class TestVoiceProcessingUpdate:
         assert update.status == ProcessingStatus.ANALYZING
         assert update.audio_file_path is None
         assert update.subject is None
+    
+    def test_voice_processing_update_is_immutable(self):
+        """Test VoiceProcessingUpdate is frozen and slotted"""
+        from dataclasses import FrozenInstanceError
+        update = VoiceProcessingUpdate(status=ProcessingStatus.READY)
+        with pytest.raises(FrozenInstanceError):
+            update.status = ProcessingStatus.ERROR
+        assert not hasattr(update, "__dict__")
 
 
 class TestServiceCommand:
@@ -82,5 +90,23 @@ class TestServiceResponse:
         assert response.response_type == "Ack"
         assert response.update is None
         assert response.error is None
-
+    
+    def test_create_update_keeps_audio_out_of_json(self):
+        """Test raw audio is carried on the response but not serialized as JSON"""
+        update = VoiceProcessingUpdate(status=ProcessingStatus.READY, audio_data=b"\x00\x01")
+        response = ServiceResponse.create_update(update)
+        assert response.audio_data == b"\x00\x01"
+        assert "audio_data" not in response.update
+        assert "audio_data" not in response.model_dump()
+    
+    def test_create_update_drops_audio_when_file_path_present(self):
+        """Test raw audio is not sent when the UI can play the file instead"""
+        update = VoiceProcessingUpdate(
+            status=ProcessingStatus.READY,
+            audio_data=b"\x00\x01",
+            audio_file_path="out.mp3"
+        )
+        response = ServiceResponse.create_update(update)
+        assert response.audio_data is None
+        assert response.update["audio_file_path"] == "out.mp3"
 
@@ -74,5 +74,210 @@ class TestAudioPlayer:
         assert player.is_playing is True
         player.is_playing = False
         assert player.is_playing is False
-
-
+    
+    def test_stream_resampler_matches_whole_signal(self):
+        """Test block-by-block resampling gives the same samples as resampling the whole signal"""
+        import numpy as np
+        from scipy import signal
+        from pyjarvis_ui.audio_player import _StreamResampler
+        
+        samples = np.random.default_rng(0).standard_normal(10000).astype(np.float32)
+        resampler = _StreamResampler(24000, 44100)
+        blocks = [resampler.process(samples[i:i + 3000]) for i in range(0, len(samples), 3000)]
+        blocks.append(resampler.flush())
+        
+        expected = signal.resample_poly(samples, 147, 80)
+        np.testing.assert_allclose(np.concatenate(blocks), expected, atol=1e-5)
+    
+    def test_current_level_tracks_played_samples(self, player):
+        """Test the level is the RMS of the most recently played samples"""
+        import numpy as np
+        
+        samples = np.full(4096, 8192, dtype='<i2')  # Constant 0.25 amplitude
+        with patch('pyjarvis_ui.audio_player.sd.OutputStream'):
+            player.play(samples.tobytes())
+        assert player.get_current_level() == 0.5  # Nothing played yet
+        
+        player._stream_callback(np.empty((512, 1), dtype=np.float32), 512, None, None)
+        assert player.get_current_level() == pytest.approx(0.5)  # rms 0.25, scaled x2
+    
+    def test_play_converts_int16_pcm_in_callback(self, player):
+        """Test play() PCM is converted to float32 as it plays, then completes and idles the stream"""
+        import numpy as np
+        from pyjarvis_ui.audio_player import sd
+        
+        pcm = np.array([0, 16384, -32768, 32767], dtype='<i2').tobytes()
+        with patch('pyjarvis_ui.audio_player.sd.OutputStream'):
+            player.play(pcm)
+        
+        outdata = np.ones((6, 1), dtype=np.float32)
+        player._stream_callback(outdata, 6, None, None)
+        np.testing.assert_array_equal(outdata[:, 0], [0.0, 0.5, -1.0, 32767 / 32768, 0.0, 0.0])
+        
+        with pytest.raises(sd.CallbackStop):
+            player._stream_callback(outdata, 6, None, None)
+        assert player.is_playing is False
+        player.current_stream.close.assert_not_called()
+    
+    def test_idle_stream_is_restarted_by_next_play(self, player):
+        """Test a stream the callback stopped after playback is restarted, not reopened, by the next play"""
+        import numpy as np
+        from pyjarvis_ui.audio_player import sd
+        
+        with patch('pyjarvis_ui.audio_player.sd.OutputStream') as mock_stream_class:
+            player.play(b'\x00\x00' * 4)
+            with pytest.raises(sd.CallbackStop):
+                for _ in range(2):
+                    player._stream_callback(np.empty((8, 1), dtype=np.float32), 8, None, None)
+            player.play(b'\x00\x00' * 4)
+        
+        mock_stream_class.assert_called_once()
+        player.current_stream.stop.assert_called_once()
+        assert player.current_stream.start.call_count == 2
+        assert player.is_playing is True
+    
+    def test_sample_ring_wraps_and_ends(self):
+        """Test the file playback ring hands samples over in order across its wrap point"""
+        import numpy as np
+        from pyjarvis_ui.audio_player import _SampleRing
+        
+        ring = _SampleRing(4)
+        out = np.zeros(3, dtype=np.float32)
+        assert ring.write(np.array([1, 2, 3], dtype=np.float32))
+        assert ring.read(out) == 3
+        assert ring.write(np.array([4, 5, 6], dtype=np.float32))
+        ring.close()
+        assert not ring.exhausted
+        assert ring.read(out) == 3
+        np.testing.assert_array_equal(out, [4, 5, 6])
+        assert ring.read(out) == 0
+        assert ring.exhausted
+    
+    def test_play_file_decodes_off_the_callback(self, player, tmp_path):
+        """Test a file is decoded on the playback thread and the callback only copies the buffered samples"""
+        import time
+        import wave
+        import numpy as np
+        from pyjarvis_ui.audio_player import sd
+        
+        wav_path = tmp_path / "ramp.wav"
+        pcm = np.arange(-1000, 1000, dtype='<i2') * 16
+        with wave.open(str(wav_path), 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(44100)
+            wav_file.writeframes(pcm.tobytes())
+        
+        with patch('pyjarvis_ui.audio_player.sd.OutputStream'):
+            player.play_file(str(wav_path))
+            # The whole file is decoded into the ring before the callback has run once
+            deadline = time.monotonic() + 1.0
+            while not (player._ring is not None and player._ring.closed) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert player._ring.closed
+            
+            played = []
+            with pytest.raises(sd.CallbackStop):
+                while True:
+                    outdata = np.empty((512, 1), dtype=np.float32)
+                    player._stream_callback(outdata, 512, None, None)
+                    played.append(outdata[:, 0].copy())
+            player._playback_thread.join(timeout=1.0)
+        
+        np.testing.assert_allclose(np.concatenate(played)[:len(pcm)], pcm / 32768.0)
+        assert not wav_path.exists()  # Deleted after playback
+    
+    def test_stream_is_shared_across_plays(self, player):
+        """Test the output stream is opened once and kept running between plays"""
+        with patch('pyjarvis_ui.audio_player.sd.OutputStream') as mock_stream_class:
+            player.play(b'\x00\x00' * 64)
+            player.stop()
+            player.play(b'\x00\x00' * 64)
+        mock_stream_class.assert_called_once()
+        player.current_stream.stop.assert_not_called()
+        
+        player.close()
+        assert player.current_stream is None
+    
+    def test_file_decoder_mixes_stereo_to_mono(self, tmp_path):
+        """Test stereo WAV blocks are decoded as the average of both channels"""
+        import wave
+        import numpy as np
+        from pyjarvis_ui.audio_player import _FileDecoder
+        
+        wav_path = tmp_path / "stereo.wav"
+        frames = np.array([[16384, 0], [-16384, -16384], [8192, 24576]], dtype='<i2')
+        with wave.open(str(wav_path), 'wb') as wav_file:
+            wav_file.setnchannels(2)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(44100)
+            wav_file.writeframes(frames.tobytes())
+        
+        decoder = _FileDecoder(wav_path, 44100, blocksize=2)
+        try:
+            blocks = [block.copy() for block in decoder.blocks()]
+        finally:
+            decoder.close()
+        np.testing.assert_array_equal(np.concatenate(blocks), [0.25, -0.5, 0.5])
+    
+    def test_file_decoder_streams_soundfile_blocks(self, tmp_path):
+        """Test non-WAV files are decoded block by block into one reused buffer"""
+        import numpy as np
+        import soundfile as sf
+        from pyjarvis_ui.audio_player import _FileDecoder
+        
+        flac_path = tmp_path / "mono.flac"
+        samples = np.linspace(-0.5, 0.5, 10, dtype=np.float32)
+        sf.write(str(flac_path), samples, 44100, subtype='PCM_16')
+        
+        decoder = _FileDecoder(flac_path, 44100, blocksize=4)
+        try:
+            blocks = list(decoder.blocks())
+            assert [len(block) for block in blocks] == [4, 4, 2]
+            assert all(np.shares_memory(block, decoder._samples) for block in blocks)
+            np.testing.assert_allclose(blocks[-1], samples[-2:], atol=1e-4)
+        finally:
+            decoder.close()
+    
+    def test_wait_for_completion_wakes_on_stop(self, player):
+        """Test wait_for_completion returns as soon as playback is stopped"""
+        import threading
+        
+        with patch('pyjarvis_ui.audio_player.sd.OutputStream'):
+            player.play(b'\x00\x00' * 44100)
+        assert not player._done.is_set()
+        
+        threading.Timer(0.05, player.stop).start()
+        player.wait_for_completion()
+        assert player._done.is_set()
+        assert player.is_playing is False
+    
+    def test_repeated_underflows_switch_to_robust_buffering(self, player):
+        """Test the stream is reopened with the large fallback buffers after repeated underflows"""
+        import numpy as np
+        
+        status = Mock(output_underflow=True)
+        with patch('pyjarvis_ui.audio_player.sd.OutputStream') as mock_stream_class:
+            player.play(b'\x00\x00' * 4096)
+            assert mock_stream_class.call_args.kwargs['blocksize'] == 1024
+            assert mock_stream_class.call_args.kwargs['latency'] == 'low'
+            
+            for _ in range(3):
+                player._stream_callback(np.empty((1024, 1), dtype=np.float32), 1024, None, status)
+            player.play(b'\x00\x00' * 4096)
+            assert mock_stream_class.call_args.kwargs['blocksize'] == 8192
+            assert mock_stream_class.call_args.kwargs['latency'] == 0.1
+    
+    @pytest.mark.parametrize("sample_width, pcm, expected", [
+        (1, [0, 128, 255], [-1.0, 0.0, 127 / 128]),
+        (2, [-32768, 0, 16384], [-1.0, 0.0, 0.5]),
+        (4, [-2147483648, 0, 1073741824], [-1.0, 0.0, 0.5]),
+    ])
+    def test_to_f32_converts_each_wav_width(self, sample_width, pcm, expected):
+        """Test the fused PCM conversion for 8-, 16- and 32-bit samples"""
+        import numpy as np
+        from pyjarvis_ui.audio_player import _PCM_FORMATS, _to_f32
+        
+        dtype, scale, bias = _PCM_FORMATS[sample_width]
+        out = np.empty(3, dtype=np.float32)
+        np.testing.assert_array_equal(_to_f32(np.array(pcm, dtype=dtype), out, scale, bias), expected)
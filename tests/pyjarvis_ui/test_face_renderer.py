@@ -29,6 +29,16 @@ class TestFaceRenderer:
         assert renderer.center_x == 400
         assert renderer.center_y == 300
     
+    def test_layout_matches_scaled_positions(self, renderer):
+        """Test the packed layout holds the same screen positions as the public attributes"""
+        assert renderer.layout.eye == (renderer.eye_x, renderer.eye_y)
+        assert renderer.layout.animation_center == (renderer.animation_center_x, renderer.animation_center_y)
+        assert renderer.layout.ring_scale == max(renderer.scale_x, renderer.scale_y)
+    
+    def test_renderer_uses_slots(self, renderer):
+        """Test FaceRenderer instances have no per-instance attribute dict"""
+        assert not hasattr(renderer, '__dict__')
+    
     def test_update_emotion(self, renderer):
         """Test updating emotion"""
         # FaceRenderer doesn't have animation_controller as attribute
@@ -55,5 +65,77 @@ class TestFaceRenderer:
         # FaceRenderer doesn't have cleanup method
         # Just verify it exists and can be called without error
         pass
-
-
+    
+    def test_eye_glow_scales_cached_sprite(self, renderer):
+        """Test the eye glow brightens the eye center more as intensity rises"""
+        import pygame
+        from types import SimpleNamespace
+        
+        levels = []
+        for mouth_open in (0.2, 0.6):
+            screen = pygame.Surface((renderer.width, renderer.height))
+            renderer._draw_eye_glow(screen, SimpleNamespace(eye_blink=0.0, mouth_open=mouth_open))
+            levels.append(screen.get_at((renderer.eye_x, renderer.eye_y)).b)
+        
+        assert 0 < levels[0] < levels[1] <= 255
+    
+    def test_animation_reuses_compositing_surface(self, renderer):
+        """Test the ring animation clears and reuses one surface instead of allocating per frame"""
+        import pygame
+        from types import SimpleNamespace
+        
+        anim_surface = renderer._anim_surface
+        screen = pygame.Surface((renderer.width, renderer.height))
+        state = SimpleNamespace(eye_blink=0.0, mouth_open=0.0, elapsed=0.25)
+        renderer._draw_multi_circle_animation(screen, state, is_speaking=False)
+        renderer._draw_multi_circle_animation(screen, state, is_speaking=True)
+        
+        assert renderer._anim_surface is anim_surface
+        assert screen.get_at((renderer.animation_center_x, renderer.animation_center_y - 5)) != (0, 0, 0, 255)
+    
+    def test_animation_composited_in_ring_bounds(self, renderer):
+        """Test the rings are composited in a square around the animation, leaving the rest of the screen alone"""
+        import pygame
+        from types import SimpleNamespace
+        
+        screen = pygame.Surface((renderer.width, renderer.height))
+        screen.fill((20, 20, 30))
+        renderer._draw_multi_circle_animation(screen, SimpleNamespace(elapsed=0.0), is_speaking=True)
+        
+        extent = renderer._anim_extent
+        assert renderer._anim_surface.get_size() == (extent * 2, extent * 2)
+        assert extent < renderer.width // 4
+        bounds = pygame.Rect(renderer._anim_pos, renderer._anim_surface.get_size())
+        assert bounds.center == (renderer.animation_center_x, renderer.animation_center_y)
+        assert screen.get_at((renderer.animation_center_x, bounds.top + 2)) != (20, 20, 30, 255)
+        assert screen.get_at((renderer.width - 1, renderer.height - 1)) == (20, 20, 30, 255)
+    
+    def test_ring_glow_uses_cached_discs(self, renderer):
+        """Test each ring's outer glow is drawn from a disc pre-rendered for its radius"""
+        import pygame
+        
+        radius = max(renderer._glow_cache)
+        target = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        target.fill((0, 0, 0, 0))
+        renderer._draw_glow_circle(target, radius, radius, radius, 255)
+        
+        assert len(renderer._glow_cache) == len(renderer.RINGS)
+        assert target.get_at((radius, radius))[:3] == renderer.GLOW_COLOR
+        assert target.get_at((0, 0)).a == 0
+    
+    def test_background_converted_to_display_format(self, tmp_path):
+        """Test the background image is converted to the display's pixel format once loaded"""
+        import pygame
+        
+        image_path = tmp_path / "face.png"
+        image = pygame.Surface((40, 20), pygame.SRCALPHA)
+        image.fill((10, 20, 30, 255))
+        pygame.image.save(image, str(image_path))
+        display = pygame.display.set_mode((80, 40))
+        try:
+            renderer = FaceRenderer(80, 40, str(image_path))
+            
+            assert renderer.background_image.get_bitsize() == display.get_bitsize()
+            assert not renderer.background_image.get_flags() & pygame.SRCALPHA
+        finally:
+            pygame.display.quit()
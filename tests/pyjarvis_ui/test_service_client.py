@@ -96,3 +96,64 @@ class TestServiceClient:
             assert client.update_callback == callback
 
 
+    
+    @pytest.mark.asyncio
+    async def test_disconnect_callback_on_connection_loss(self, client):
+        """Test the disconnect callback runs when the broadcast listener stops"""
+        import asyncio
+        client.reader = AsyncMock()
+        client.reader.readexactly = AsyncMock(side_effect=asyncio.IncompleteReadError(b"", 4))
+        client.connected = True
+        client.disconnect_callback = Mock()
+        
+        await client._listen_for_broadcasts()
+        
+        assert client.connected is False
+        client.disconnect_callback.assert_called_once()
+    
+    def test_parse_update_enum_values(self, client):
+        """Test status/emotion values map to enum members, with fallbacks for unknown values"""
+        from pyjarvis_shared import Emotion, ProcessingStatus
+        update = client._parse_update({"status": "Error", "emotion": "Happy", "audio_file_path": "a.wav"})
+        assert update.status is ProcessingStatus.ERROR
+        assert update.emotion is Emotion.HAPPY
+        
+        update = client._parse_update({"status": "Unknown", "emotion": "Unknown"})
+        assert update.status is ProcessingStatus.READY
+        assert update.emotion is None
+    
+    @pytest.mark.asyncio
+    async def test_receive_large_message(self, client):
+        """Test a message larger than 64KB is read whole"""
+        import asyncio
+        payload = b'{"response_type":"Error","error":"' + b'x' * 200000 + b'"}'
+        client.reader = asyncio.StreamReader()
+        client.reader.feed_data(struct.pack('<I', len(payload)) + payload)
+        
+        response = await client._receive_message()
+        
+        assert response.response_type == "Error"
+        assert len(response.error) == 200000
+    
+    @pytest.mark.asyncio
+    async def test_send_message_frames_command_json(self, client):
+        """Test a command is sent as a length-prefixed JSON document in a single write"""
+        import json
+        command = ServiceCommand.process_text(TextToVoiceRequest(text="Olá", language="pt"))
+        client.writer = Mock()
+        client.writer.drain = AsyncMock()
+        
+        await client._send_message(command)
+        
+        client.writer.write.assert_called_once()
+        frame = client.writer.write.call_args.args[0]
+        assert struct.unpack('<I', frame[:4])[0] == len(frame) - 4
+        assert json.loads(frame[4:]) == command.model_dump()
+    
+    def test_parse_update_ignores_in_band_hex_audio(self, client):
+        """Test audio is only taken from a binary frame, never decoded from hex in the JSON"""
+        update = client._parse_update({"status": "Ready", "audio_data": "0001"})
+        assert update.audio_data is None
+        
+        update = client._parse_update({"status": "Ready"}, b"\x00\x01")
+        assert update.audio_data == b"\x00\x01"